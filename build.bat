@@ -95,6 +95,7 @@ REM Build the executable with --onefile
     --hidden-import=core ^
     --hidden-import=core.scene_data ^
     --hidden-import=core.animation_detector ^
+    --hidden-import=core.numba_support ^
     --hidden-import=exporters ^
     --hidden-import=exporters.base_exporter ^
     --hidden-import=exporters.ae_exporter ^
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Numba Support Module
+Optional JIT compilation for numeric hot loops
+
+Numba is an optional dependency. When it is installed, kernels decorated
+with njit are compiled to native code; otherwise NUMBA_AVAILABLE is False
+and callers use their NumPy implementation instead.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ['njit', 'prange', 'NUMBA_AVAILABLE']
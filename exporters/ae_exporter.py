@@ -12,10 +12,23 @@ import os
 import re
 from pathlib import Path
 
+import numpy as np
+
 from .base_exporter import BaseExporter
 from core.scene_data import SceneData, AnimationType
 
 
+# Per-keyframe array pushes, filled with one %-format call per object
+_KEYFRAME_PUSH = (
+    "timesArray.push(%.10f);\n"
+    "posArray.push([%.10f, %.10f, %.10f]);\n"
+    "rotXArray.push(%.10f);\n"
+    "rotYArray.push(%.10f);\n"
+    "rotZArray.push(%.10f);"
+)
+_KEYFRAME_PUSH_SCALE = _KEYFRAME_PUSH + "\nscaleArray.push([%.10f, %.10f, %.10f]);"
+
+
 class AfterEffectsExporter(BaseExporter):
     """After Effects JSX + OBJ exporter with vertex animation filtering
 
@@ -72,68 +85,64 @@ class AfterEffectsExporter(BaseExporter):
 
             duration = frame_count / fps
 
-            # Generate JSX
-            jsx_lines = []
-
-            # Header
-            jsx_lines.extend(self._generate_header(shot_name, source_filename))
-
-            # Helper functions
-            jsx_lines.extend(self._generate_helper_functions())
-
-            # Main function start
-            jsx_lines.append("function SceneImportFunction() {")
-            jsx_lines.append("")
-            jsx_lines.append("app.exitAfterLaunchAndEval = false;")
-            jsx_lines.append("")
-            jsx_lines.append("app.beginUndoGroup('Scene Import');")
-            jsx_lines.append("")
-
-            # Create composition
-            jsx_lines.append(f"var comp = app.project.items.addComp('{shot_name}', {comp_width}, {comp_height}, 1.0, {duration}, {fps});")
-            jsx_lines.append("comp.displayStartFrame = 1;")
-            jsx_lines.append("")
-
-            # Import footage if available
-            if footage_path:
-                jsx_lines.extend(self._generate_footage_import(footage_path, shot_name))
-
-            # Process cameras
-            for camera in scene_data.cameras:
-                cam_name = camera.parent_name if camera.parent_name else camera.name
-                self.log(f"Processing camera: {cam_name}")
-                camera_jsx = self._process_camera(camera, cam_name, frame_count, fps, comp_width, comp_height)
-                jsx_lines.extend(camera_jsx)
-                jsx_lines.append("")
-
-            # Process meshes (skip vertex-animated ones)
-            for mesh in scene_data.meshes:
-                mesh_name = mesh.parent_name if mesh.parent_name else mesh.name
-
-                # Skip if mesh has vertex animation
-                if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
-                    self.log(f"Skipping vertex-animated mesh: {mesh_name}")
-                    continue
-
-                self.log(f"Processing geometry: {mesh_name}")
-                geom_jsx = self._process_geometry(mesh, mesh_name, frame_count, fps, output_dir, comp_width, comp_height)
-                jsx_lines.extend(geom_jsx)
-                jsx_lines.append("")
-
-            # Process transforms (locators/nulls)
-            for transform in scene_data.transforms:
-                self.log(f"Processing locator: {transform.name}")
-                loc_jsx = self._process_locator(transform, transform.name, frame_count, fps, comp_width, comp_height)
-                jsx_lines.extend(loc_jsx)
-                jsx_lines.append("")
-
-            # Footer
-            jsx_lines.extend(self._generate_footer())
-
-            # Write JSX file
+            # Stream JSX straight to a buffered file, one object block at a time
             jsx_file = output_dir / f"{shot_name}.jsx"
-            with open(jsx_file, 'w') as f:
-                f.write("\n".join(jsx_lines))
+            with open(jsx_file, 'w', buffering=self.WRITE_BUFFER_SIZE) as f:
+                # Header
+                self._write_lines(f, self._generate_header(shot_name, source_filename))
+
+                # Helper functions
+                self._write_lines(f, self._generate_helper_functions())
+
+                # Main function start
+                self._write_lines(f, [
+                    "function SceneImportFunction() {",
+                    "",
+                    "app.exitAfterLaunchAndEval = false;",
+                    "",
+                    "app.beginUndoGroup('Scene Import');",
+                    "",
+                    # Create composition
+                    f"var comp = app.project.items.addComp('{shot_name}', {comp_width}, {comp_height}, 1.0, {duration}, {fps});",
+                    "comp.displayStartFrame = 1;",
+                    "",
+                ])
+
+                # Import footage if available
+                if footage_path:
+                    self._write_lines(f, self._generate_footage_import(footage_path, shot_name))
+
+                # Process cameras
+                for camera in scene_data.cameras:
+                    cam_name = camera.parent_name if camera.parent_name else camera.name
+                    self.log(f"Processing camera: {cam_name}")
+                    camera_jsx = self._process_camera(camera, cam_name, frame_count, fps, comp_width, comp_height)
+                    camera_jsx.append("")
+                    self._write_lines(f, camera_jsx)
+
+                # Process meshes (skip vertex-animated ones)
+                for mesh in scene_data.meshes:
+                    mesh_name = mesh.parent_name if mesh.parent_name else mesh.name
+
+                    # Skip if mesh has vertex animation
+                    if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
+                        self.log(f"Skipping vertex-animated mesh: {mesh_name}")
+                        continue
+
+                    self.log(f"Processing geometry: {mesh_name}")
+                    geom_jsx = self._process_geometry(mesh, mesh_name, frame_count, fps, output_dir, comp_width, comp_height)
+                    geom_jsx.append("")
+                    self._write_lines(f, geom_jsx)
+
+                # Process transforms (locators/nulls)
+                for transform in scene_data.transforms:
+                    self.log(f"Processing locator: {transform.name}")
+                    loc_jsx = self._process_locator(transform, transform.name, frame_count, fps, comp_width, comp_height)
+                    loc_jsx.append("")
+                    self._write_lines(f, loc_jsx)
+
+                # Footer
+                self._write_lines(f, self._generate_footer())
 
             # Collect OBJ files
             obj_files = list(output_dir.glob('*.obj'))
@@ -295,6 +304,48 @@ class AfterEffectsExporter(BaseExporter):
 
         return False
 
+    def _generate_keyframe_pushes(self, keyframes, fps, comp_width, comp_height, include_scale=False):
+        """Generate the per-keyframe array pushes for one object as a single JSX block
+
+        Converts all keyframes to AE composition space with array operations,
+        then fills a repeated line template in one %-format call.
+
+        Args:
+            keyframes: Non-empty list of Keyframe objects
+            fps: Frames per second
+            comp_width: Composition width in pixels
+            comp_height: Composition height in pixels
+            include_scale: Also push scale values (meshes)
+
+        Returns:
+            str: Newline-separated push statements for all keyframes
+        """
+        frames = np.array([kf.frame for kf in keyframes], dtype=np.float64)
+        positions = np.array([kf.position for kf in keyframes], dtype=np.float64)
+        rotations = np.array([kf.rotation_ae for kf in keyframes], dtype=np.float64)
+
+        # AE time: frame 1 = time 0, frame 2 = time 1/fps, etc.
+        columns = [
+            (frames - 1) / fps,
+            # Transform coordinates for AE (Y-up to AE composition space)
+            positions[:, 0] * 10 + comp_width / 2,
+            -positions[:, 1] * 10 + comp_height / 2,
+            -positions[:, 2] * 10,
+            -rotations[:, 0],
+            rotations[:, 1],
+            rotations[:, 2],
+        ]
+        template = _KEYFRAME_PUSH
+
+        if include_scale:
+            # AE scale is in percent, compensate for world-scale OBJ vertices
+            scales = np.array([kf.scale for kf in keyframes], dtype=np.float64) * 2
+            columns.extend([scales[:, 0], scales[:, 1], scales[:, 2]])
+            template = _KEYFRAME_PUSH_SCALE
+
+        values = np.column_stack(columns).ravel().tolist()
+        return "\n".join([template] * len(keyframes)) % tuple(values)
+
     def _process_camera(self, camera, name, frame_count, fps, comp_width, comp_height):
         """Process camera and return JSX with array-based animation"""
         jsx = []
@@ -321,23 +372,8 @@ class AfterEffectsExporter(BaseExporter):
         jsx.append(f"var rotZArray = new Array();")
 
         # Coordinate system transformation (Y-up to AE composition space)
-        comp_center_x = comp_width / 2
-        comp_center_y = comp_height / 2
-
-        for kf in camera.keyframes:
-            # AE time: frame 1 = time 0, frame 2 = time 1/fps, etc.
-            time_seconds = (kf.frame - 1) / fps
-
-            # Transform coordinates for AE
-            x_ae = kf.position[0] * 10 + comp_center_x
-            y_ae = -kf.position[1] * 10 + comp_center_y
-            z_ae = -kf.position[2] * 10
-
-            jsx.append(f"timesArray.push({time_seconds:.10f});")
-            jsx.append(f"posArray.push([{x_ae:.10f}, {y_ae:.10f}, {z_ae:.10f}]);")
-            jsx.append(f"rotXArray.push({-kf.rotation_ae[0]:.10f});")
-            jsx.append(f"rotYArray.push({kf.rotation_ae[1]:.10f});")
-            jsx.append(f"rotZArray.push({kf.rotation_ae[2]:.10f});")
+        if camera.keyframes:
+            jsx.append(self._generate_keyframe_pushes(camera.keyframes, fps, comp_width, comp_height))
 
         # Apply arrays to properties
         jsx.append(f"{layer_var}.position.setValuesAtTimes(timesArray, posArray);")
@@ -387,25 +423,8 @@ class AfterEffectsExporter(BaseExporter):
             jsx.append(f"var rotZArray = new Array();")
             jsx.append(f"var scaleArray = new Array();")
 
-            comp_center_x = comp_width / 2
-            comp_center_y = comp_height / 2
-
-            for kf in keyframes:
-                time_seconds = (kf.frame - 1) / fps
-
-                x_ae = kf.position[0] * 10 + comp_center_x
-                y_ae = -kf.position[1] * 10 + comp_center_y
-                z_ae = -kf.position[2] * 10
-
-                # AE scale is in percent, compensate for world-scale OBJ vertices
-                scale = [s * 2 for s in kf.scale]
-
-                jsx.append(f"timesArray.push({time_seconds:.10f});")
-                jsx.append(f"posArray.push([{x_ae:.10f}, {y_ae:.10f}, {z_ae:.10f}]);")
-                jsx.append(f"rotXArray.push({-kf.rotation_ae[0]:.10f});")
-                jsx.append(f"rotYArray.push({kf.rotation_ae[1]:.10f});")
-                jsx.append(f"rotZArray.push({kf.rotation_ae[2]:.10f});")
-                jsx.append(f"scaleArray.push([{scale[0]:.10f}, {scale[1]:.10f}, {scale[2]:.10f}]);")
+            jsx.append(self._generate_keyframe_pushes(keyframes, fps, comp_width, comp_height,
+                                                      include_scale=True))
 
             jsx.append(f"{layer_var}.position.setValuesAtTimes(timesArray, posArray);")
             jsx.append(f"{layer_var}.rotationX.setValuesAtTimes(timesArray, rotXArray);")
@@ -458,21 +477,7 @@ class AfterEffectsExporter(BaseExporter):
             jsx.append(f"var rotYArray = new Array();")
             jsx.append(f"var rotZArray = new Array();")
 
-            comp_center_x = comp_width / 2
-            comp_center_y = comp_height / 2
-
-            for kf in keyframes:
-                time_seconds = (kf.frame - 1) / fps
-
-                x_ae = kf.position[0] * 10 + comp_center_x
-                y_ae = -kf.position[1] * 10 + comp_center_y
-                z_ae = -kf.position[2] * 10
-
-                jsx.append(f"timesArray.push({time_seconds:.10f});")
-                jsx.append(f"posArray.push([{x_ae:.10f}, {y_ae:.10f}, {z_ae:.10f}]);")
-                jsx.append(f"rotXArray.push({-kf.rotation_ae[0]:.10f});")
-                jsx.append(f"rotYArray.push({kf.rotation_ae[1]:.10f});")
-                jsx.append(f"rotZArray.push({kf.rotation_ae[2]:.10f});")
+            jsx.append(self._generate_keyframe_pushes(keyframes, fps, comp_width, comp_height))
 
             jsx.append(f"{layer_var}.position.setValuesAtTimes(timesArray, posArray);")
             jsx.append(f"{layer_var}.rotationX.setValuesAtTimes(timesArray, rotXArray);")
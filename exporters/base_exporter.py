@@ -28,6 +28,9 @@ class BaseExporter(ABC):
     - Format Agnostic: Works with SceneData, not reader objects (v2.5.0+)
     """
 
+    # Output buffer size for exported text files (1 MB)
+    WRITE_BUFFER_SIZE = 1024 * 1024
+
     def __init__(self, progress_callback=None):
         """Initialize exporter
 
@@ -47,6 +50,18 @@ class BaseExporter(ABC):
             self.progress_callback(message)
         print(message)
 
+    def _write_lines(self, f, lines):
+        """Write a block of lines to an open text file, newline-terminated
+
+        Args:
+            f: Open file to write to
+            lines: List of lines; nothing is written when empty
+        """
+        if not lines:
+            return
+        f.write("\n".join(lines))
+        f.write("\n")
+
     @abstractmethod
     def export(self, scene_data: 'SceneData', output_path, shot_name):
         """Export scene data to specific format
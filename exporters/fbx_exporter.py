@@ -15,8 +15,46 @@ FBX ASCII format based on FBX 7.4 specification.
 import re
 from pathlib import Path
 from datetime import datetime
+
+import numpy as np
+
 from exporters.base_exporter import BaseExporter
 from core.scene_data import SceneData, AnimationType
+from core.numba_support import njit, NUMBA_AVAILABLE
+
+
+def _format_float_array(values):
+    """Format floats as a comma-separated %.6f list with a single format call"""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    return ",".join(["%.6f"] * values.size) % tuple(values.tolist())
+
+
+# Bound formatter for scalar %.6f fields, skips per-call format-spec parsing
+_F6 = "{:.6f}".format
+
+
+def _format_vec3(v):
+    """Format a 3-component vector as x,y,z with %.6f precision"""
+    return "%.6f,%.6f,%.6f" % (v[0], v[1], v[2])
+
+
+def _format_int_array(values):
+    """Format integers as a comma-separated list"""
+    return ",".join(map(str, np.asarray(values, dtype=np.int64).ravel().tolist()))
+
+
+@njit(cache=True)
+def _build_polygon_vertex_index_jit(indices, counts):
+    """Numba kernel for FBXExporter._build_polygon_vertex_index"""
+    out = np.empty(indices.size, dtype=np.int64)
+    offset = 0
+    for count in counts:
+        for i in range(count - 1):
+            out[offset + i] = indices[offset + i]
+        # Last index is negative (XOR with -1)
+        out[offset + count - 1] = -indices[offset + count - 1] - 1
+        offset += count
+    return out[:offset]
 
 
 class FBXExporter(BaseExporter):
@@ -25,11 +63,56 @@ class FBXExporter(BaseExporter):
     v2.6.2: Added scene hierarchy preservation from full_path data.
     """
 
+    # FBX time units per second (KTime)
+    FBX_TIME_UNITS_PER_SECOND = 46186158000
+
+    # Constant parts of every mesh Geometry block, joined once at class load.
+    # Per-mesh data (normals, UVs) is written between them.
+    _NORMAL_LAYER_HEADER = "\n".join([
+        '        }',
+        '        GeometryVersion: 124',
+        '        LayerElementNormal: 0 {',
+        '            Version: 102',
+        '            Name: ""',
+        '            MappingInformationType: "ByPolygonVertex"',
+        '            ReferenceInformationType: "Direct"',
+    ])
+    _UV_LAYER_HEADER = "\n".join([
+        '            }',
+        '        }',
+        '        LayerElementUV: 0 {',
+        '            Version: 101',
+        '            Name: "UVMap"',
+        '            MappingInformationType: "ByPolygonVertex"',
+        '            ReferenceInformationType: "Direct"',
+    ])
+    _GEOMETRY_LAYER_FOOTER = "\n".join([
+        '            }',
+        '        }',
+        '        Layer: 0 {',
+        '            Version: 100',
+        '            LayerElement:  {',
+        '                Type: "LayerElementNormal"',
+        '                TypedIndex: 0',
+        '            }',
+        '            LayerElement:  {',
+        '                Type: "LayerElementUV"',
+        '                TypedIndex: 0',
+        '            }',
+        '        }',
+        '    }',
+    ])
+
+    # Characters not allowed in FBX node names
+    _SANITIZE_RE = re.compile(r'[^a-zA-Z0-9_]')
+
     def __init__(self, progress_callback=None):
         super().__init__(progress_callback)
         self.shot_name = ""
         self.fps = 24.0
         self.frame_count = 1
+        self._time_scale = self.FBX_TIME_UNITS_PER_SECOND / self.fps
+        self._end_time = int(self.frame_count * self._time_scale)
 
         # Object ID tracking (FBX uses unique 64-bit IDs)
         # Start at 1000000001 to reserve 1000000000 for Document
@@ -37,13 +120,21 @@ class FBXExporter(BaseExporter):
         self._object_ids = {}  # name -> id mapping
         self._connections = []  # List of (child_id, parent_id, property) tuples
         self._created_groups = set()  # Track created hierarchy group names
+        self._key_attr_cache = {}  # key_count -> (flags, data, refcount) strings
+        # Per-export caches keyed by id() of a camera/mesh/transform in the
+        # SceneData being exported (alive for the whole export), filled by
+        # _cache_object_transforms() before any section is written
+        self._keyframe_array_cache = {}  # id(obj) -> (positions, rotations) arrays
+        self._initial_xforms = {}  # id(obj) -> (position, rotation, scale)
 
     def _get_id(self, name):
         """Get or create unique ID for an object"""
-        if name not in self._object_ids:
-            self._object_ids[name] = self._next_id
-            self._next_id += 1
-        return self._object_ids[name]
+        obj_id = self._object_ids.get(name)
+        if obj_id is None:
+            obj_id = self._next_id
+            self._object_ids[name] = obj_id
+            self._next_id = obj_id + 1
+        return obj_id
 
     def get_format_name(self):
         return "FBX"
@@ -63,11 +154,17 @@ class FBXExporter(BaseExporter):
             self.shot_name = shot_name
             self.fps = scene_data.metadata.fps
             self.frame_count = scene_data.metadata.frame_count
+            # Time conversion: frames to FBX time, shared by every section
+            self._time_scale = self.FBX_TIME_UNITS_PER_SECOND / self.fps
+            self._end_time = int(self.frame_count * self._time_scale)
             self._object_ids = {}
             self._connections = []
             # Start at 1000000001 to reserve 1000000000 for Document
             self._next_id = 1000000001
             self._created_groups = set()
+            self._key_attr_cache = {}
+            self._keyframe_array_cache = {}
+            self._initial_xforms = {}
 
             self.log(f"Exporting FBX format for Unreal Engine...")
 
@@ -75,133 +172,139 @@ class FBXExporter(BaseExporter):
             self.validate_output_path(output_dir)
             fbx_file = output_dir / f"{shot_name}.fbx"
 
-            lines = []
-
-            # === FBX HEADER ===
-            lines.extend(self._write_header())
-
-            # === GLOBAL SETTINGS (Z-up for UE) ===
-            lines.extend(self._write_global_settings())
-
-            # === DOCUMENTS ===
-            lines.extend(self._write_documents())
-
-            # === REFERENCES ===
-            lines.extend(self._write_references())
-
-            # === HIERARCHY SETUP ===
-            hierarchy_map = self._build_hierarchy_map(scene_data)
-            hierarchy_groups = self._get_hierarchy_groups(scene_data)
-
-            # === DEFINITIONS ===
-            # Count objects for definitions
-            num_cameras = len(scene_data.cameras)
-            num_meshes = sum(1 for m in scene_data.meshes
-                           if m.animation_type != AnimationType.VERTEX_ANIMATED)
-            num_locators = len(scene_data.transforms)
-            num_groups = len(hierarchy_groups)
-
-            # Count blend shape objects
-            num_blend_shape_deformers = 0
-            num_blend_shape_channels = 0
-            num_shape_geometries = 0
-            for mesh in scene_data.meshes:
-                if mesh.animation_type == AnimationType.BLEND_SHAPE and mesh.blend_shapes:
-                    num_blend_shape_deformers += 1
-                    for channel in mesh.blend_shapes.channels:
-                        num_blend_shape_channels += 1
-                        num_shape_geometries += len(channel.targets)
-
-            # Count animation curve nodes and curves
-            num_anim_curve_nodes, num_anim_curves = self._count_animation_curves(scene_data)
-
-            lines.extend(self._write_definitions(
-                num_cameras, num_meshes, num_locators, num_groups,
-                num_blend_shape_deformers, num_blend_shape_channels, num_shape_geometries,
-                num_anim_curve_nodes, num_anim_curves
-            ))
-
-            # === PRE-REGISTER ALL MODEL IDS ===
-            # This ensures parent checks work regardless of object write order
-            # (e.g., cameras written before locators can still find locator parents)
-            for group_name, _ in hierarchy_groups:
-                self._get_id(f"Model::{group_name}")
-            for cam in scene_data.cameras:
-                display_name = cam.parent_name if cam.parent_name else cam.name
-                self._get_id(f"Model::{self._sanitize_name(display_name)}")
-            for mesh in scene_data.meshes:
-                if mesh.animation_type != AnimationType.VERTEX_ANIMATED:
-                    display_name = mesh.parent_name if mesh.parent_name else mesh.name
+            # Sections are streamed straight to a buffered file handle
+            with open(fbx_file, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as buf:
+                # === FBX HEADER ===
+                self._write_header(buf)
+
+                # === GLOBAL SETTINGS (Z-up for UE) ===
+                self._write_global_settings(buf)
+
+                # === DOCUMENTS ===
+                self._write_documents(buf)
+
+                # === REFERENCES ===
+                self._write_references(buf)
+
+                # === HIERARCHY SETUP ===
+                hierarchy_map = self._build_hierarchy_map(scene_data)
+                hierarchy_groups = self._get_hierarchy_groups(scene_data)
+
+                # === PER-OBJECT TRANSFORMS ===
+                # Convert every object's keyframes once, up front
+                for cam in scene_data.cameras:
+                    self._cache_object_transforms(cam)
+                for mesh in scene_data.meshes:
+                    if mesh.animation_type != AnimationType.VERTEX_ANIMATED:
+                        self._cache_object_transforms(mesh)
+                for transform in scene_data.transforms:
+                    if transform.keyframes:
+                        self._cache_object_transforms(transform)
+
+                # === DEFINITIONS ===
+                # Count objects for definitions
+                num_cameras = len(scene_data.cameras)
+                num_meshes = sum(1 for m in scene_data.meshes
+                               if m.animation_type != AnimationType.VERTEX_ANIMATED)
+                num_locators = len(scene_data.transforms)
+                num_groups = len(hierarchy_groups)
+
+                # Count blend shape objects
+                num_blend_shape_deformers = 0
+                num_blend_shape_channels = 0
+                num_shape_geometries = 0
+                for mesh in scene_data.meshes:
+                    if mesh.animation_type == AnimationType.BLEND_SHAPE and mesh.blend_shapes:
+                        num_blend_shape_deformers += 1
+                        for channel in mesh.blend_shapes.channels:
+                            num_blend_shape_channels += 1
+                            num_shape_geometries += len(channel.targets)
+
+                # Count animation curve nodes and curves
+                num_anim_curve_nodes, num_anim_curves = self._count_animation_curves(scene_data)
+
+                self._write_definitions(
+                    buf, num_cameras, num_meshes, num_locators, num_groups,
+                    num_blend_shape_deformers, num_blend_shape_channels, num_shape_geometries,
+                    num_anim_curve_nodes, num_anim_curves
+                )
+
+                # === PRE-REGISTER ALL MODEL IDS ===
+                # This ensures parent checks work regardless of object write order
+                # (e.g., cameras written before locators can still find locator parents)
+                for group_name, _ in hierarchy_groups:
+                    self._get_id(f"Model::{group_name}")
+                for cam in scene_data.cameras:
+                    display_name = cam.parent_name if cam.parent_name else cam.name
                     self._get_id(f"Model::{self._sanitize_name(display_name)}")
-            for transform in scene_data.transforms:
-                if transform.keyframes:
-                    self._get_id(f"Model::{self._sanitize_name(transform.name)}")
-
-            # === OBJECTS ===
-            lines.append("Objects:  {")
-
-            # Create hierarchy groups first (as Null nodes)
-            if hierarchy_groups:
-                for group_name, parent_name in hierarchy_groups:
-                    if group_name not in self._created_groups:
-                        # Ensure parent exists
-                        if parent_name and parent_name not in self._created_groups:
-                            lines.extend(self._write_hierarchy_group(parent_name, None))
-                        lines.extend(self._write_hierarchy_group(group_name, parent_name))
-                        self.log(f"  Creating hierarchy group: {group_name}")
-
-            # Export cameras with hierarchy
-            for cam in scene_data.cameras:
-                display_name = cam.parent_name if cam.parent_name else cam.name
-                cam_name = self._sanitize_name(display_name)
-                parent = self._get_node_parent(cam.full_path, hierarchy_map)
-                self.log(f"  Processing camera: {cam_name}" + (f" (parent: {parent})" if parent else ""))
-                lines.extend(self._write_camera(cam, cam_name, parent))
-
-            # Export meshes (skip raw vertex-animated, but keep blend shapes) with hierarchy
-            skipped_meshes = []
-            for mesh in scene_data.meshes:
-                display_name = mesh.parent_name if mesh.parent_name else mesh.name
-                mesh_name = self._sanitize_name(display_name)
-
-                if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
-                    skipped_meshes.append(mesh_name)
-                    self.log(f"  Skipping vertex-animated mesh: {mesh_name}")
-                    continue
+                for mesh in scene_data.meshes:
+                    if mesh.animation_type != AnimationType.VERTEX_ANIMATED:
+                        display_name = mesh.parent_name if mesh.parent_name else mesh.name
+                        self._get_id(f"Model::{self._sanitize_name(display_name)}")
+                for transform in scene_data.transforms:
+                    if transform.keyframes:
+                        self._get_id(f"Model::{self._sanitize_name(transform.name)}")
+
+                # === OBJECTS ===
+                buf.write("Objects:  {\n")
+
+                # Create hierarchy groups first (as Null nodes)
+                if hierarchy_groups:
+                    for group_name, parent_name in hierarchy_groups:
+                        if group_name not in self._created_groups:
+                            # Ensure parent exists
+                            if parent_name and parent_name not in self._created_groups:
+                                self._write_hierarchy_group(buf, parent_name, None)
+                            self._write_hierarchy_group(buf, group_name, parent_name)
+                            self.log(f"  Creating hierarchy group: {group_name}")
+
+                # Export cameras with hierarchy
+                for cam in scene_data.cameras:
+                    display_name = cam.parent_name if cam.parent_name else cam.name
+                    cam_name = self._sanitize_name(display_name)
+                    parent = self._get_node_parent(cam.full_path, hierarchy_map)
+                    self.log(f"  Processing camera: {cam_name}" + (f" (parent: {parent})" if parent else ""))
+                    self._write_camera(buf, cam, cam_name, parent)
+
+                # Export meshes (skip raw vertex-animated, but keep blend shapes) with hierarchy
+                skipped_meshes = []
+                for mesh in scene_data.meshes:
+                    display_name = mesh.parent_name if mesh.parent_name else mesh.name
+                    mesh_name = self._sanitize_name(display_name)
 
-                parent = self._get_node_parent(mesh.full_path, hierarchy_map)
+                    if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
+                        skipped_meshes.append(mesh_name)
+                        self.log(f"  Skipping vertex-animated mesh: {mesh_name}")
+                        continue
 
-                if mesh.animation_type == AnimationType.BLEND_SHAPE:
-                    self.log(f"  Processing mesh with blend shapes: {mesh_name}" + (f" (parent: {parent})" if parent else ""))
-                else:
-                    self.log(f"  Processing mesh: {mesh_name}" + (f" (parent: {parent})" if parent else ""))
+                    parent = self._get_node_parent(mesh.full_path, hierarchy_map)
 
-                lines.extend(self._write_mesh(mesh, mesh_name, parent))
+                    if mesh.animation_type == AnimationType.BLEND_SHAPE:
+                        self.log(f"  Processing mesh with blend shapes: {mesh_name}" + (f" (parent: {parent})" if parent else ""))
+                    else:
+                        self.log(f"  Processing mesh: {mesh_name}" + (f" (parent: {parent})" if parent else ""))
 
-            # Export locators/transforms with hierarchy
-            for transform in scene_data.transforms:
-                xform_name = self._sanitize_name(transform.name)
-                if not transform.keyframes:
-                    continue
-                parent = self._get_node_parent(transform.full_path, hierarchy_map)
-                self.log(f"  Processing locator: {xform_name}" + (f" (parent: {parent})" if parent else ""))
-                lines.extend(self._write_locator(transform, xform_name, parent))
+                    self._write_mesh(buf, mesh, mesh_name, parent)
 
-            # Write animation stacks
-            lines.extend(self._write_animation_stack())
+                # Export locators/transforms with hierarchy
+                for transform in scene_data.transforms:
+                    xform_name = self._sanitize_name(transform.name)
+                    if not transform.keyframes:
+                        continue
+                    parent = self._get_node_parent(transform.full_path, hierarchy_map)
+                    self.log(f"  Processing locator: {xform_name}" + (f" (parent: {parent})" if parent else ""))
+                    self._write_locator(buf, transform, xform_name, parent)
 
-            lines.append("}")
-            lines.append("")
+                # Write animation stacks
+                self._write_animation_stack(buf)
 
-            # === CONNECTIONS ===
-            lines.extend(self._write_connections())
+                buf.write("}\n\n")
 
-            # === TAKES ===
-            lines.extend(self._write_takes())
+                # === CONNECTIONS ===
+                self._write_connections(buf)
 
-            # Write file
-            with open(fbx_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
+                # === TAKES ===
+                self._write_takes(buf)
 
             self.log(f"FBX file created: {fbx_file.name}")
 
@@ -245,66 +348,163 @@ class FBXExporter(BaseExporter):
             rot = rot[0]
         return (float(rot[0]), float(rot[1]), float(rot[2]))
 
+    def _cache_object_transforms(self, obj_data):
+        """Convert an object's keyframes once per export
+
+        Stores the first-frame transform in self._initial_xforms and, for
+        animated objects, (N, 3) position/rotation arrays in
+        self._keyframe_array_cache, so the Definitions count, the object
+        writers and the curve writers share one conversion. The arrays are a
+        vectorized equivalent of _convert_position/_convert_rotation on every
+        keyframe, including the nested [[x, y, z]] edge case.
+
+        Both caches are keyed by the object itself rather than its sanitized
+        name, since distinct objects can sanitize to the same name.
+
+        Args:
+            obj_data: CameraData, MeshData or TransformData from SceneData
+        """
+        key = id(obj_data)
+        keyframes = obj_data.keyframes
+        if not keyframes:
+            self._initial_xforms[key] = ((0, 0, 0), (0, 0, 0), (1, 1, 1))
+            return
+
+        kf = keyframes[0]
+        self._initial_xforms[key] = (self._convert_position(kf.position),
+                                      self._convert_rotation(kf.rotation_maya),
+                                      kf.scale)
+
+        count = len(keyframes)
+        if count >= 2:
+            positions = np.asarray([kf.position for kf in keyframes], dtype=np.float64)
+            rotations = np.asarray([kf.rotation_maya for kf in keyframes], dtype=np.float64)
+            self._keyframe_array_cache[key] = (positions.reshape(count, -1)[:, :3],
+                                               rotations.reshape(count, -1)[:, :3])
+
+    def _key_times(self, keys):
+        """Convert the frame numbers of a key list to FBX KTime in one pass
+
+        Args:
+            keys: List of Keyframe or BlendShapeWeightKey objects
+
+        Returns:
+            ndarray: int64 key times
+        """
+        frames = np.fromiter((kf.frame for kf in keys), dtype=np.float64, count=len(keys))
+        return (frames * self._time_scale).astype(np.int64)
+
+    def _animated_axes(self, values):
+        """Flag which columns of an (N, 3) keyframe array actually change
+
+        A channel counts as animated when its peak-to-peak range exceeds
+        1e-4, computed for all three axes in a single pass.
+
+        Args:
+            values: float64 array of shape (N, 3)
+
+        Returns:
+            list: [x_animated, y_animated, z_animated] as bools
+        """
+        return (np.ptp(values, axis=0) > 1e-4).tolist()
+
+    def _key_attr_strings(self, key_count):
+        """Get the constant per-key attribute arrays for an animation curve
+
+        Every curve uses linear interpolation with zeroed tangent data, so
+        these strings depend only on the key count and are cached per export.
+
+        Args:
+            key_count: Number of keys on the curve
+
+        Returns:
+            tuple: (attr_flags, attr_data, ref_count) comma-joined strings
+        """
+        cached = self._key_attr_cache.get(key_count)
+        if cached is None:
+            cached = (
+                # AttrFlags: all linear interpolation
+                ",".join(["24836"] * key_count),
+                # AttrData: 4 zeros per key (tangent data)
+                ",".join(["0,0,0,0"] * key_count),
+                ",".join(["1"] * key_count),
+            )
+            self._key_attr_cache[key_count] = cached
+        return cached
+
+    def _build_polygon_vertex_index(self, indices, counts):
+        """Build the FBX PolygonVertexIndex array
+
+        FBX marks the last vertex of each polygon by storing it as -index - 1.
+        Uses a Numba kernel when available, otherwise a vectorized NumPy pass.
+
+        Args:
+            indices: Flat list of face vertex indices
+            counts: List of vertex counts per face
+
+        Returns:
+            ndarray: int64 polygon vertex indices
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
+
+        if NUMBA_AVAILABLE:
+            return _build_polygon_vertex_index_jit(indices, counts)
+
+        total = int(counts.sum())
+        poly_indices = indices[:total].copy()
+        # Last index of each polygon is negative (XOR with -1)
+        ends = np.cumsum(counts) - 1
+        poly_indices[ends] = -poly_indices[ends] - 1
+        return poly_indices
+
     def _compute_face_normals(self, positions, indices, counts):
         """Compute flat face normals for FBX mesh
 
         Computes one normal per face vertex (flat shading).
-        Normals are computed using cross product of face edges.
+        Normals are computed using cross product of face edges,
+        vectorized over all faces at once.
 
         Args:
-            positions: List of vertex positions [(x,y,z), ...]
+            positions: Vertex positions as an (N, 3) array
             indices: Flat list of face vertex indices
             counts: List of vertex counts per face
 
         Returns:
-            list: Normals in polygon-vertex order [(nx,ny,nz), ...]
+            ndarray: Normals in polygon-vertex order, shape (M, 3)
         """
-        import math
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        indices = np.asarray(indices, dtype=np.int64)
+        counts = np.asarray(counts, dtype=np.int64)
 
-        normals = []
-        idx_offset = 0
-
-        for face_vert_count in counts:
-            if face_vert_count < 3:
-                # Degenerate face, use up vector
-                for _ in range(face_vert_count):
-                    normals.append((0.0, 0.0, 1.0))
-                idx_offset += face_vert_count
-                continue
+        # Default up vector for degenerate faces (< 3 vertices)
+        face_normals = np.tile(np.array([0.0, 0.0, 1.0]), (counts.size, 1))
 
-            # Get first three vertices of the face
-            v0_idx = indices[idx_offset]
-            v1_idx = indices[idx_offset + 1]
-            v2_idx = indices[idx_offset + 2]
+        valid = counts >= 3
+        if valid.any():
+            # Out-of-range vertex indices read as the origin
+            num_points = len(positions)
+            padded = np.vstack([positions, np.zeros((1, 3))])
+            offsets = (np.cumsum(counts) - counts)[valid]
 
-            v0 = positions[v0_idx] if v0_idx < len(positions) else (0, 0, 0)
-            v1 = positions[v1_idx] if v1_idx < len(positions) else (0, 0, 0)
-            v2 = positions[v2_idx] if v2_idx < len(positions) else (0, 0, 0)
+            def face_vertex(k):
+                idx = indices[offsets + k]
+                return padded[np.where(idx < num_points, idx, num_points)]
 
-            # Compute two edges
-            edge1 = (v1[0] - v0[0], v1[1] - v0[1], v1[2] - v0[2])
-            edge2 = (v2[0] - v0[0], v2[1] - v0[1], v2[2] - v0[2])
+            v0, v1, v2 = face_vertex(0), face_vertex(1), face_vertex(2)
 
             # Cross product for normal (edge2 x edge1 for correct winding)
-            nx = edge2[1] * edge1[2] - edge2[2] * edge1[1]
-            ny = edge2[2] * edge1[0] - edge2[0] * edge1[2]
-            nz = edge2[0] * edge1[1] - edge2[1] * edge1[0]
+            normals = np.cross(v2 - v0, v1 - v0)
 
-            # Normalize
-            length = math.sqrt(nx * nx + ny * ny + nz * nz)
-            if length > 1e-10:
-                nx, ny, nz = nx / length, ny / length, nz / length
-            else:
-                # Fallback for degenerate faces
-                nx, ny, nz = 0.0, 0.0, 1.0
+            # Normalize, falling back to the up vector for degenerate faces
+            length = np.sqrt((normals * normals).sum(axis=1))
+            good = length > 1e-10
+            normals[good] /= length[good, None]
+            normals[~good] = (0.0, 0.0, 1.0)
+            face_normals[valid] = normals
 
-            # Repeat normal for each vertex in the face (flat shading)
-            for _ in range(face_vert_count):
-                normals.append((nx, ny, nz))
-
-            idx_offset += face_vert_count
-
-        return normals
+        # Repeat normal for each vertex in the face (flat shading)
+        return np.repeat(face_normals, counts, axis=0)
 
     def _count_animation_curves(self, scene_data):
         """Pre-calculate the number of animation curve nodes and curves
@@ -315,39 +515,28 @@ class FBXExporter(BaseExporter):
         Returns:
             tuple: (num_anim_curve_nodes, num_anim_curves)
         """
-        def is_animated(vals):
-            return len(set(round(v, 4) for v in vals)) > 1
-
         total_curve_nodes = 0
         total_curves = 0
 
-        # Helper to count for a list of keyframes
-        def count_for_keyframes(keyframes):
-            if not keyframes or len(keyframes) < 2:
+        # Helper to count for an object, using its cached keyframe arrays
+        def count_for_object(obj_data):
+            if not obj_data.keyframes or len(obj_data.keyframes) < 2:
                 return 0, 0
 
             nodes = 0
             curves = 0
 
             # Extract position and rotation values
-            positions = [self._convert_position(kf.position) for kf in keyframes]
-            rotations = [self._convert_rotation(kf.rotation_maya) for kf in keyframes]
-
-            tx = [p[0] for p in positions]
-            ty = [p[1] for p in positions]
-            tz = [p[2] for p in positions]
-            rx = [r[0] for r in rotations]
-            ry = [r[1] for r in rotations]
-            rz = [r[2] for r in rotations]
+            positions, rotations = self._keyframe_array_cache[id(obj_data)]
 
             # Check translation
-            trans_animated = [is_animated(tx), is_animated(ty), is_animated(tz)]
+            trans_animated = self._animated_axes(positions)
             if any(trans_animated):
                 nodes += 1
                 curves += sum(trans_animated)
 
             # Check rotation
-            rot_animated = [is_animated(rx), is_animated(ry), is_animated(rz)]
+            rot_animated = self._animated_axes(rotations)
             if any(rot_animated):
                 nodes += 1
                 curves += sum(rot_animated)
@@ -356,21 +545,21 @@ class FBXExporter(BaseExporter):
 
         # Count for cameras
         for cam in scene_data.cameras:
-            n, c = count_for_keyframes(cam.keyframes)
+            n, c = count_for_object(cam)
             total_curve_nodes += n
             total_curves += c
 
         # Count for meshes (only transform-only animation)
         for mesh in scene_data.meshes:
             if mesh.animation_type == AnimationType.TRANSFORM_ONLY:
-                n, c = count_for_keyframes(mesh.keyframes)
+                n, c = count_for_object(mesh)
                 total_curve_nodes += n
                 total_curves += c
 
         # Count for locators/transforms
         for transform in scene_data.transforms:
             if transform.keyframes:
-                n, c = count_for_keyframes(transform.keyframes)
+                n, c = count_for_object(transform)
                 total_curve_nodes += n
                 total_curves += c
 
@@ -386,10 +575,10 @@ class FBXExporter(BaseExporter):
 
     # === FBX STRUCTURE WRITERS ===
 
-    def _write_header(self):
+    def _write_header(self, buf):
         """Write FBX ASCII header"""
         timestamp = datetime.now().strftime("%Y/%m/%d %H:%M:%S.000")
-        return [
+        self._write_lines(buf, [
             "; FBX 7.4.0 project file",
             "; Created by MultiConverter",
             "; ----------------------------------------------------",
@@ -423,11 +612,11 @@ class FBXExporter(BaseExporter):
             "    }",
             "}",
             "",
-        ]
+        ])
 
-    def _write_global_settings(self):
+    def _write_global_settings(self, buf):
         """Write global settings with Y-up axis (Maya/Alembic native)"""
-        return [
+        self._write_lines(buf, [
             "GlobalSettings:  {",
             "    Version: 1000",
             "    Properties70:  {",
@@ -442,16 +631,16 @@ class FBXExporter(BaseExporter):
             f'        P: "UnitScaleFactor", "double", "Number", "",1',
             f'        P: "OriginalUnitScaleFactor", "double", "Number", "",1',
             f'        P: "TimeSpanStart", "KTime", "Time", "",0',
-            f'        P: "TimeSpanStop", "KTime", "Time", "",{int(self.frame_count * 46186158000 / self.fps)}',
+            f'        P: "TimeSpanStop", "KTime", "Time", "",{self._end_time}',
             f'        P: "CustomFrameRate", "double", "Number", "",{self.fps}',
             "    }",
             "}",
             "",
-        ]
+        ])
 
-    def _write_documents(self):
+    def _write_documents(self, buf):
         """Write documents section"""
-        return [
+        self._write_lines(buf, [
             "Documents:  {",
             "    Count: 1",
             "    Document: 1000000000, \"\", \"Scene\" {",
@@ -463,22 +652,23 @@ class FBXExporter(BaseExporter):
             "    }",
             "}",
             "",
-        ]
+        ])
 
-    def _write_references(self):
+    def _write_references(self, buf):
         """Write references section (empty for our exports)"""
-        return [
+        self._write_lines(buf, [
             "References:  {",
             "}",
             "",
-        ]
+        ])
 
-    def _write_definitions(self, num_cameras, num_meshes, num_locators, num_groups=0,
+    def _write_definitions(self, buf, num_cameras, num_meshes, num_locators, num_groups=0,
                            num_bs_deformers=0, num_bs_channels=0, num_shape_geoms=0,
                            num_anim_curve_nodes=0, num_anim_curves=0):
         """Write object type definitions
 
         Args:
+            buf: Writable text buffer for FBX output
             num_cameras: Number of camera nodes
             num_meshes: Number of mesh nodes
             num_locators: Number of locator/tracking marker nodes (use NodeAttribute Null)
@@ -500,7 +690,7 @@ class FBXExporter(BaseExporter):
         if num_anim_curve_nodes > 0:
             total_count += num_anim_curve_nodes + num_anim_curves
 
-        lines = [
+        self._write_lines(buf, [
             "Definitions:  {",
             "    Version: 100",
             f"    Count: {total_count}",
@@ -540,9 +730,9 @@ class FBXExporter(BaseExporter):
             "            }",
             "        }",
             "    }",
-        ]
+        ])
 
-        lines.extend([
+        self._write_lines(buf, [
             '    ObjectType: "AnimationStack" {',
             "        Count: 1",
             "    }",
@@ -553,7 +743,7 @@ class FBXExporter(BaseExporter):
 
         # Add AnimationCurveNode definition if we have animation
         if num_anim_curve_nodes > 0:
-            lines.extend([
+            self._write_lines(buf, [
                 f'    ObjectType: "AnimationCurveNode" {{',
                 f"        Count: {num_anim_curve_nodes}",
                 "    }",
@@ -561,7 +751,7 @@ class FBXExporter(BaseExporter):
 
         # Add AnimationCurve definition if we have animation
         if num_anim_curves > 0:
-            lines.extend([
+            self._write_lines(buf, [
                 f'    ObjectType: "AnimationCurve" {{',
                 f"        Count: {num_anim_curves}",
                 "    }",
@@ -569,45 +759,36 @@ class FBXExporter(BaseExporter):
 
         # Add Deformer definition if we have blend shapes
         if total_deformers > 0:
-            lines.extend([
+            self._write_lines(buf, [
                 f'    ObjectType: "Deformer" {{',
                 f"        Count: {total_deformers}",
                 "    }",
             ])
 
-        lines.extend([
+        self._write_lines(buf, [
             "}",
             "",
         ])
 
-        return lines
-
-    def _write_camera(self, cam_data, cam_name, parent_name=None):
+    def _write_camera(self, buf, cam_data, cam_name, parent_name=None):
         """Write camera node and attributes
 
         Args:
+            buf: Writable text buffer for FBX output
             cam_data: CameraData from SceneData
             cam_name: Sanitized camera name
             parent_name: Optional parent node name for hierarchy
         """
-        lines = []
-
         model_id = self._get_id(f"Model::{cam_name}")
         cam_id = self._get_id(f"NodeAttribute::{cam_name}")
 
-        # Get initial transform (converted to Z-up)
-        if cam_data.keyframes:
-            kf = cam_data.keyframes[0]
-            pos = self._convert_position(kf.position)
-            rot = self._convert_rotation(kf.rotation_maya)
-        else:
-            pos = (0, 0, 0)
-            rot = (0, 0, 0)
+        # Get initial transform
+        pos, rot, _ = self._initial_xforms[id(cam_data)]
 
         focal_length = cam_data.properties.focal_length
 
         # Camera as NodeAttribute (Maya-compatible format)
-        lines.extend([
+        self._write_lines(buf, [
             f'    NodeAttribute: {cam_id}, "NodeAttribute::{cam_name}", "Camera" {{',
             '        Properties70:  {',
             f'            P: "FocalLength", "Number", "", "A",{focal_length}',
@@ -628,7 +809,7 @@ class FBXExporter(BaseExporter):
 
         # Camera model
         # PostRotation -90 on Y aligns FBX camera's default orientation with Maya convention
-        lines.extend([
+        self._write_lines(buf, [
             f'    Model: {model_id}, "Model::{cam_name}", "Camera" {{',
             '        Version: 232',
             '        Properties70:  {',
@@ -637,8 +818,8 @@ class FBXExporter(BaseExporter):
             '            P: "InheritType", "enum", "", "",1',
             '            P: "ScalingMax", "Vector3D", "Vector", "",0,0,0',
             '            P: "DefaultAttributeIndex", "int", "Integer", "",0',
-            f'            P: "Lcl Translation", "Lcl Translation", "", "A",{pos[0]:.6f},{pos[1]:.6f},{pos[2]:.6f}',
-            f'            P: "Lcl Rotation", "Lcl Rotation", "", "A",{rot[0]:.6f},{rot[1]:.6f},{rot[2]:.6f}',
+            f'            P: "Lcl Translation", "Lcl Translation", "", "A",{_format_vec3(pos)}',
+            f'            P: "Lcl Rotation", "Lcl Rotation", "", "A",{_format_vec3(rot)}',
             '            P: "Lcl Scaling", "Lcl Scaling", "", "A",1,1,1',
             '        }',
             '        Shading: Y',
@@ -658,35 +839,18 @@ class FBXExporter(BaseExporter):
         self._connections.append((cam_id, model_id, None))
 
         # Add animation curves
-        self._add_animation_curves(cam_data.keyframes, cam_name, lines)
-
-        return lines
+        self._add_animation_curves(cam_data, cam_name, buf)
 
-    def _write_mesh(self, mesh_data, mesh_name, parent_name=None):
-        """Write mesh geometry and model node
+    def _format_mesh_geometry(self, mesh_data, pos):
+        """Format the body of a mesh Geometry block
 
         Args:
             mesh_data: MeshData from SceneData
-            mesh_name: Sanitized mesh name
-            parent_name: Optional parent node name for hierarchy
-        """
-        lines = []
+            pos: Initial model position, used to move vertices into local space
 
-        model_id = self._get_id(f"Model::{mesh_name}")
-        geom_id = self._get_id(f"Geometry::{mesh_name}")
-
-        # Get initial transform (converted to Z-up)
-        if mesh_data.keyframes:
-            kf = mesh_data.keyframes[0]
-            pos = self._convert_position(kf.position)
-            rot = self._convert_rotation(kf.rotation_maya)
-            scale = kf.scale
-        else:
-            pos = (0, 0, 0)
-            rot = (0, 0, 0)
-            scale = (1, 1, 1)
-
-        # === GEOMETRY ===
+        Returns:
+            str: Newline-terminated Geometry lines following the header line
+        """
         positions = mesh_data.geometry.positions
         indices = mesh_data.geometry.indices
         counts = mesh_data.geometry.counts
@@ -694,83 +858,54 @@ class FBXExporter(BaseExporter):
         # Convert positions and transform from world space to local space
         # Alembic stores mesh vertices in world space, but FBX expects local space
         # (the Model transform will position them back in world space)
-        converted_positions = []
-        for p in positions:
-            world_pos = self._convert_position(p)
-            # Transform to local space by subtracting model position
-            local_pos = (
-                world_pos[0] - pos[0],
-                world_pos[1] - pos[1],
-                world_pos[2] - pos[2]
-            )
-            converted_positions.append(local_pos)
+        local_positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3) - pos
 
         # Flatten positions for FBX format
-        pos_array = []
-        for p in converted_positions:
-            pos_array.extend([p[0], p[1], p[2]])
+        pos_array = local_positions.ravel()
 
         # Build polygon vertex indices (negative marks end of polygon in FBX)
-        poly_indices = []
-        idx_offset = 0
-        for count in counts:
-            for i in range(count - 1):
-                poly_indices.append(indices[idx_offset + i])
-            # Last index is negative (XOR with -1)
-            poly_indices.append(-indices[idx_offset + count - 1] - 1)
-            idx_offset += count
-
-        # Compute face normals (using converted Z-up positions)
-        normals = self._compute_face_normals(converted_positions, indices, counts)
-
-        # Flatten normals for FBX format
-        normals_array = []
-        for n in normals:
-            normals_array.extend([n[0], n[1], n[2]])
-
-        lines.extend([
-            f'    Geometry: {geom_id}, "Geometry::{mesh_name}", "Mesh" {{',
+        poly_indices = self._build_polygon_vertex_index(indices, counts)
+
+        # Compute face normals (using local-space positions)
+        normals_array = self._compute_face_normals(local_positions, indices, counts).ravel()
+
+        return "\n".join([
             f'        Vertices: *{len(pos_array)} {{',
-            f'            a: {",".join(f"{v:.6f}" for v in pos_array)}',
+            f'            a: {_format_float_array(pos_array)}',
             '        }',
             f'        PolygonVertexIndex: *{len(poly_indices)} {{',
-            f'            a: {",".join(str(i) for i in poly_indices)}',
-            '        }',
-            '        GeometryVersion: 124',
-            '        LayerElementNormal: 0 {',
-            '            Version: 102',
-            '            Name: ""',
-            '            MappingInformationType: "ByPolygonVertex"',
-            '            ReferenceInformationType: "Direct"',
+            f'            a: {_format_int_array(poly_indices)}',
+            self._NORMAL_LAYER_HEADER,
             f'            Normals: *{len(normals_array)} {{',
-            f'                a: {",".join(f"{v:.6f}" for v in normals_array)}',
-            '            }',
-            '        }',
-            '        LayerElementUV: 0 {',
-            '            Version: 101',
-            '            Name: "UVMap"',
-            '            MappingInformationType: "ByPolygonVertex"',
-            '            ReferenceInformationType: "Direct"',
+            f'                a: {_format_float_array(normals_array)}',
+            self._UV_LAYER_HEADER,
             f'            UV: *{len(poly_indices) * 2} {{',
             f'                a: {",".join(["0,0"] * len(poly_indices))}',
-            '            }',
-            '        }',
-            '        Layer: 0 {',
-            '            Version: 100',
-            '            LayerElement:  {',
-            '                Type: "LayerElementNormal"',
-            '                TypedIndex: 0',
-            '            }',
-            '            LayerElement:  {',
-            '                Type: "LayerElementUV"',
-            '                TypedIndex: 0',
-            '            }',
-            '        }',
-            '    }',
-        ])
+            self._GEOMETRY_LAYER_FOOTER,
+        ]) + "\n"
+
+    def _write_mesh(self, buf, mesh_data, mesh_name, parent_name=None):
+        """Write mesh geometry and model node
+
+        Args:
+            buf: Writable text buffer for FBX output
+            mesh_data: MeshData from SceneData
+            mesh_name: Sanitized mesh name
+            parent_name: Optional parent node name for hierarchy
+        """
+        model_id = self._get_id(f"Model::{mesh_name}")
+        geom_id = self._get_id(f"Geometry::{mesh_name}")
+
+        # Get initial transform
+        pos, rot, scale = self._initial_xforms[id(mesh_data)]
+
+        # === GEOMETRY ===
+        # Formatted per mesh and written at once, so only one mesh's text is held
+        buf.write(f'    Geometry: {geom_id}, "Geometry::{mesh_name}", "Mesh" {{\n')
+        buf.write(self._format_mesh_geometry(mesh_data, pos))
 
         # === MODEL ===
-        lines.extend([
+        self._write_lines(buf, [
             f'    Model: {model_id}, "Model::{mesh_name}", "Mesh" {{',
             '        Version: 232',
             '        Properties70:  {',
@@ -778,9 +913,9 @@ class FBXExporter(BaseExporter):
             '            P: "InheritType", "enum", "", "",1',
             '            P: "ScalingMax", "Vector3D", "Vector", "",0,0,0',
             '            P: "DefaultAttributeIndex", "int", "Integer", "",0',
-            f'            P: "Lcl Translation", "Lcl Translation", "", "A",{pos[0]:.6f},{pos[1]:.6f},{pos[2]:.6f}',
-            f'            P: "Lcl Rotation", "Lcl Rotation", "", "A",{rot[0]:.6f},{rot[1]:.6f},{rot[2]:.6f}',
-            f'            P: "Lcl Scaling", "Lcl Scaling", "", "A",{scale[0]:.6f},{scale[1]:.6f},{scale[2]:.6f}',
+            f'            P: "Lcl Translation", "Lcl Translation", "", "A",{_format_vec3(pos)}',
+            f'            P: "Lcl Rotation", "Lcl Rotation", "", "A",{_format_vec3(rot)}',
+            f'            P: "Lcl Scaling", "Lcl Scaling", "", "A",{_format_vec3(scale)}',
             '        }',
             '        Shading: T',
             '        Culling: "CullingOff"',
@@ -800,30 +935,24 @@ class FBXExporter(BaseExporter):
 
         # Add animation curves if animated
         if mesh_data.animation_type == AnimationType.TRANSFORM_ONLY:
-            self._add_animation_curves(mesh_data.keyframes, mesh_name, lines)
+            self._add_animation_curves(mesh_data, mesh_name, buf)
 
         # Add blend shapes if present
         if mesh_data.animation_type == AnimationType.BLEND_SHAPE and mesh_data.blend_shapes:
-            lines.extend(self._write_blend_shapes(mesh_data.blend_shapes, mesh_name, geom_id))
+            self._write_blend_shapes(buf, mesh_data.blend_shapes, mesh_name, geom_id)
 
-        return lines
-
-    def _write_blend_shapes(self, blend_shapes, mesh_name, geom_id):
+    def _write_blend_shapes(self, buf, blend_shapes, mesh_name, geom_id):
         """Write blend shape deformers and shape geometries
 
         Args:
+            buf: Writable text buffer for FBX output
             blend_shapes: BlendShapeDeformer from scene_data
             mesh_name: Sanitized mesh name
             geom_id: Geometry ID to connect deformer to
-
-        Returns:
-            list: FBX lines for blend shape deformer
         """
-        lines = []
-
         # Create BlendShape deformer
         deformer_id = self._get_id(f"Deformer::{blend_shapes.name}")
-        lines.extend([
+        self._write_lines(buf, [
             f'    Deformer: {deformer_id}, "Deformer::{blend_shapes.name}", "BlendShape" {{',
             '        Version: 100',
             '    }',
@@ -842,7 +971,7 @@ class FBXExporter(BaseExporter):
             # Build FullWeights array (one entry per target)
             full_weights = [int(t.full_weight * 100) for t in channel.targets]
 
-            lines.extend([
+            self._write_lines(buf, [
                 f'    Deformer: {channel_id}, "SubDeformer::{channel.name}", "BlendShapeChannel" {{',
                 '        Version: 100',
                 f'        DeformPercent: {deform_percent:.1f}',
@@ -863,13 +992,13 @@ class FBXExporter(BaseExporter):
                 converted_deltas = [self._convert_position(d) for d in target.deltas]
 
                 # Flatten indices and vertices
-                indices_str = ",".join(str(i) for i in target.vertex_indices)
+                indices_str = _format_int_array(target.vertex_indices)
                 vertices_flat = []
                 for d in converted_deltas:
                     vertices_flat.extend([d[0], d[1], d[2]])
-                vertices_str = ",".join(f"{v:.6f}" for v in vertices_flat)
+                vertices_str = _format_float_array(vertices_flat)
 
-                lines.extend([
+                self._write_lines(buf, [
                     f'    Geometry: {shape_id}, "Geometry::{target.name}", "Shape" {{',
                     '        Version: 100',
                     f'        Indexes: *{len(target.vertex_indices)} {{',
@@ -886,16 +1015,14 @@ class FBXExporter(BaseExporter):
 
             # Add weight animation if present
             if channel.weight_animation:
-                self._add_blend_shape_weight_animation(channel, lines)
-
-        return lines
+                self._add_blend_shape_weight_animation(channel, buf)
 
-    def _add_blend_shape_weight_animation(self, channel, lines):
+    def _add_blend_shape_weight_animation(self, channel, buf):
         """Add animation curve for blend shape weight
 
         Args:
             channel: BlendShapeChannel with weight_animation
-            lines: List to append FBX lines to
+            buf: Writable text buffer for FBX output
         """
         if not channel.weight_animation:
             return
@@ -903,20 +1030,17 @@ class FBXExporter(BaseExporter):
         anim_layer_id = self._get_id("AnimationLayer::BaseLayer")
         channel_id = self._get_id(f"SubDeformer::{channel.name}")
 
-        # Time conversion: frames to FBX time (46186158000 units per second)
-        time_scale = 46186158000 / self.fps
-
         # Build keyframe data
-        times = [int(kf.frame * time_scale) for kf in channel.weight_animation]
+        times = self._key_times(channel.weight_animation)
         # Convert weights from 0-1 to 0-100 for FBX
         values = [kf.weight * 100.0 for kf in channel.weight_animation]
 
         # Create AnimCurveNode for DeformPercent
         curve_node_id = self._get_id(f"AnimCurveNode::{channel.name}_DeformPercent")
-        lines.extend([
+        self._write_lines(buf, [
             f'    AnimationCurveNode: {curve_node_id}, "AnimCurveNode::DeformPercent", "" {{',
             '        Properties70:  {',
-            f'            P: "d|DeformPercent", "Number", "", "A",{values[0]:.6f}',
+            f'            P: "d|DeformPercent", "Number", "", "A",{_F6(values[0])}',
             '        }',
             '    }',
         ])
@@ -928,15 +1052,11 @@ class FBXExporter(BaseExporter):
         # Create AnimCurve
         curve_id = self._get_id(f"AnimCurve::{channel.name}_DeformPercent")
         key_count = len(times)
-        time_str = ",".join(str(t) for t in times)
-        val_str = ",".join(f"{v:.6f}" for v in values)
-
-        # AttrFlags: all linear interpolation
-        attr_flags = ",".join(["24836"] * key_count)
-        # AttrData: 4 zeros per key (tangent data)
-        attr_data = ",".join(["0,0,0,0"] * key_count)
+        time_str = _format_int_array(times)
+        val_str = _format_float_array(values)
+        attr_flags, attr_data, ref_count = self._key_attr_strings(key_count)
 
-        lines.extend([
+        self._write_lines(buf, [
             f'    AnimationCurve: {curve_id}, "AnimCurve::", "" {{',
             '        Default: 0',
             '        KeyVer: 4009',
@@ -953,7 +1073,7 @@ class FBXExporter(BaseExporter):
             f'            a: {attr_data}',
             '        }',
             f'        KeyAttrRefCount: *{key_count} {{',
-            f'            a: {",".join(["1"] * key_count)}',
+            f'            a: {ref_count}',
             '        }',
             '    }',
         ])
@@ -961,48 +1081,39 @@ class FBXExporter(BaseExporter):
         # Connect curve to curve node
         self._connections.append((curve_id, curve_node_id, "d|DeformPercent"))
 
-    def _write_locator(self, transform_data, loc_name, parent_name=None):
+    def _write_locator(self, buf, transform_data, loc_name, parent_name=None):
         """Write locator/tracking point node using FBX NodeAttribute Null type
 
         FBX NodeAttribute Null is used for locators/tracking points.
         This creates a Null transform in Maya that appears in the Outliner.
 
         Args:
+            buf: Writable text buffer for FBX output
             transform_data: TransformData from SceneData
             loc_name: Sanitized locator name
             parent_name: Optional parent node name for hierarchy
         """
-        lines = []
-
         model_id = self._get_id(f"Model::{loc_name}")
         nodeattr_id = self._get_id(f"NodeAttribute::{loc_name}")
 
         # Get initial transform
-        if transform_data.keyframes:
-            kf = transform_data.keyframes[0]
-            pos = self._convert_position(kf.position)
-            rot = self._convert_rotation(kf.rotation_maya)
-            scale = kf.scale
-        else:
-            pos = (0, 0, 0)
-            rot = (0, 0, 0)
-            scale = (1, 1, 1)
+        pos, rot, scale = self._initial_xforms[id(transform_data)]
 
         # NodeAttribute Null object (for locators/tracking points)
-        lines.extend([
+        self._write_lines(buf, [
             f'    NodeAttribute: {nodeattr_id}, "NodeAttribute::{loc_name}", "Null" {{',
             '        TypeFlags: "Null"',
             '    }',
         ])
 
         # Model Null (transform node)
-        lines.extend([
+        self._write_lines(buf, [
             f'    Model: {model_id}, "Model::{loc_name}", "Null" {{',
             '        Version: 232',
             '        Properties70:  {',
-            f'            P: "Lcl Translation", "Lcl Translation", "", "A",{pos[0]:.6f},{pos[1]:.6f},{pos[2]:.6f}',
-            f'            P: "Lcl Rotation", "Lcl Rotation", "", "A",{rot[0]:.6f},{rot[1]:.6f},{rot[2]:.6f}',
-            f'            P: "Lcl Scaling", "Lcl Scaling", "", "A",{scale[0]:.6f},{scale[1]:.6f},{scale[2]:.6f}',
+            f'            P: "Lcl Translation", "Lcl Translation", "", "A",{_format_vec3(pos)}',
+            f'            P: "Lcl Rotation", "Lcl Rotation", "", "A",{_format_vec3(rot)}',
+            f'            P: "Lcl Scaling", "Lcl Scaling", "", "A",{_format_vec3(scale)}',
             '        }',
             '        Shading: Y',
             '        Culling: "CullingOff"',
@@ -1021,64 +1132,59 @@ class FBXExporter(BaseExporter):
             self._connections.append((model_id, 0, None))
 
         # Add animation curves
-        self._add_animation_curves(transform_data.keyframes, loc_name, lines)
+        self._add_animation_curves(transform_data, loc_name, buf)
 
-        return lines
+    def _add_animation_curves(self, obj_data, obj_name, buf):
+        """Add animation curve nodes for an object
 
-    def _add_animation_curves(self, keyframes, obj_name, lines):
-        """Add animation curve nodes for an object"""
+        Args:
+            obj_data: CameraData, MeshData or TransformData from SceneData
+            obj_name: Sanitized object name
+            buf: Writable text buffer for FBX output
+        """
+        keyframes = obj_data.keyframes
         if not keyframes or len(keyframes) < 2:
             return
 
         model_id = self._get_id(f"Model::{obj_name}")
         anim_layer_id = self._get_id("AnimationLayer::BaseLayer")
 
-        # Time conversion: frames to FBX time (46186158000 units per second)
-        time_scale = 46186158000 / self.fps
-
-        def is_animated(vals):
-            return len(set(round(v, 4) for v in vals)) > 1
-
         # Extract and convert values
-        times = [int(kf.frame * time_scale) for kf in keyframes]
-
-        # Convert positions to Z-up
-        positions = [self._convert_position(kf.position) for kf in keyframes]
-        tx = [p[0] for p in positions]
-        ty = [p[1] for p in positions]
-        tz = [p[2] for p in positions]
+        times = self._key_times(keyframes)
+        key_count = len(times)
+        # Key times are shared by every curve on this object
+        time_str = _format_int_array(times)
 
-        # Convert rotations to Z-up
-        rotations = [self._convert_rotation(kf.rotation_maya) for kf in keyframes]
-        rx = [r[0] for r in rotations]
-        ry = [r[1] for r in rotations]
-        rz = [r[2] for r in rotations]
+        # Convert positions and rotations for all keyframes at once
+        positions, rotations = self._keyframe_array_cache[id(obj_data)]
+        tx, ty, tz = positions[:, 0], positions[:, 1], positions[:, 2]
+        rx, ry, rz = rotations[:, 0], rotations[:, 1], rotations[:, 2]
 
         channels = [
             ('T', 'Lcl Translation', [
                 ('X', tx), ('Y', ty), ('Z', tz)
-            ]),
+            ], self._animated_axes(positions)),
             ('R', 'Lcl Rotation', [
                 ('X', rx), ('Y', ry), ('Z', rz)
-            ]),
+            ], self._animated_axes(rotations)),
         ]
 
-        for prefix, prop_name, axes in channels:
+        for prefix, prop_name, axes, animated in channels:
             # Check if any axis is animated
-            if not any(is_animated(vals) for _, vals in axes):
+            if not any(animated):
                 continue
 
             # AnimCurveNode
             curve_node_id = self._get_id(f"AnimCurveNode::{obj_name}_{prefix}")
 
-            default_vals = [axes[0][1][0], axes[1][1][0], axes[2][1][0]]
+            default_x, default_y, default_z = (_F6(axis_vals[0]) for _, axis_vals in axes)
 
-            lines.extend([
+            self._write_lines(buf, [
                 f'    AnimationCurveNode: {curve_node_id}, "AnimCurveNode::{prefix}", "" {{',
                 '        Properties70:  {',
-                f'            P: "d|X", "Number", "", "A",{default_vals[0]:.6f}',
-                f'            P: "d|Y", "Number", "", "A",{default_vals[1]:.6f}',
-                f'            P: "d|Z", "Number", "", "A",{default_vals[2]:.6f}',
+                f'            P: "d|X", "Number", "", "A",{default_x}',
+                f'            P: "d|Y", "Number", "", "A",{default_y}',
+                f'            P: "d|Z", "Number", "", "A",{default_z}',
                 '        }',
                 '    }',
             ])
@@ -1088,23 +1194,17 @@ class FBXExporter(BaseExporter):
             self._connections.append((curve_node_id, model_id, prop_name))
 
             # AnimCurves for each axis
-            for axis_name, vals in axes:
-                if not is_animated(vals):
+            for (axis_name, vals), axis_animated in zip(axes, animated):
+                if not axis_animated:
                     continue
 
                 curve_id = self._get_id(f"AnimCurve::{obj_name}_{prefix}_{axis_name}")
 
                 # Build keyframe data
-                key_count = len(times)
-                time_str = ",".join(str(t) for t in times)
-                val_str = ",".join(f"{v:.6f}" for v in vals)
+                val_str = _format_float_array(vals)
+                attr_flags, attr_data, ref_count = self._key_attr_strings(key_count)
 
-                # AttrFlags: all linear interpolation
-                attr_flags = ",".join(["24836"] * key_count)
-                # AttrData: 4 zeros per key (tangent data)
-                attr_data = ",".join(["0,0,0,0"] * key_count)
-
-                lines.extend([
+                self._write_lines(buf, [
                     f'    AnimationCurve: {curve_id}, "AnimCurve::", "" {{',
                     '        Default: 0',
                     f'        KeyVer: 4009',
@@ -1121,7 +1221,7 @@ class FBXExporter(BaseExporter):
                     f'            a: {attr_data}',
                     '        }',
                     f'        KeyAttrRefCount: *{key_count} {{',
-                    f'            a: {",".join(["1"] * key_count)}',
+                    f'            a: {ref_count}',
                     '        }',
                     '    }',
                 ])
@@ -1129,22 +1229,16 @@ class FBXExporter(BaseExporter):
                 # Connect curve to curve node
                 self._connections.append((curve_id, curve_node_id, f"d|{axis_name}"))
 
-    def _write_animation_stack(self):
+    def _write_animation_stack(self, buf):
         """Write animation stack and layer"""
-        lines = []
-
         stack_id = self._get_id("AnimationStack::Take001")
         layer_id = self._get_id("AnimationLayer::BaseLayer")
 
-        # Time span
-        time_scale = 46186158000 / self.fps
-        end_time = int(self.frame_count * time_scale)
-
-        lines.extend([
+        self._write_lines(buf, [
             f'    AnimationStack: {stack_id}, "AnimStack::Take 001", "" {{',
             '        Properties70:  {',
-            f'            P: "LocalStop", "KTime", "Time", "",{end_time}',
-            f'            P: "ReferenceStop", "KTime", "Time", "",{end_time}',
+            f'            P: "LocalStop", "KTime", "Time", "",{self._end_time}',
+            f'            P: "ReferenceStop", "KTime", "Time", "",{self._end_time}',
             '        }',
             '    }',
             f'    AnimationLayer: {layer_id}, "AnimLayer::BaseLayer", "" {{',
@@ -1154,43 +1248,31 @@ class FBXExporter(BaseExporter):
         # Connect layer to stack
         self._connections.append((layer_id, stack_id, None))
 
-        return lines
-
-    def _write_connections(self):
+    def _write_connections(self, buf):
         """Write all object connections"""
+        # "OP" is a property connection, "OO" an object-object connection
         lines = [
-            "Connections:  {",
+            f'    C: "OP",{child_id},{parent_id}, "{prop}"' if prop
+            else f'    C: "OO",{child_id},{parent_id}'
+            for child_id, parent_id, prop in self._connections
         ]
 
-        for child_id, parent_id, prop in self._connections:
-            if prop:
-                # Property connection
-                lines.append(f'    C: "OP",{child_id},{parent_id}, "{prop}"')
-            else:
-                # Object-Object connection
-                lines.append(f'    C: "OO",{child_id},{parent_id}')
-
-        lines.append("}")
-        lines.append("")
-
-        return lines
+        buf.write("Connections:  {\n")
+        self._write_lines(buf, lines)
+        buf.write("}\n\n")
 
-    def _write_takes(self):
+    def _write_takes(self, buf):
         """Write takes section"""
-        time_scale = 46186158000 / self.fps
-        end_time = int(self.frame_count * time_scale)
-
-        return [
+        self._write_lines(buf, [
             "Takes:  {",
             '    Current: "Take 001"',
             '    Take: "Take 001" {',
             f'        FileName: "Take_001.tak"',
-            f'        LocalTime: 0,{end_time}',
-            f'        ReferenceTime: 0,{end_time}',
+            f'        LocalTime: 0,{self._end_time}',
+            f'        ReferenceTime: 0,{self._end_time}',
             '    }',
             "}",
-            "",
-        ]
+        ])
 
     # === HIERARCHY UTILITIES ===
 
@@ -1272,26 +1354,26 @@ class FBXExporter(BaseExporter):
 
         return None
 
-    def _write_hierarchy_group(self, group_name, parent_name=None):
+    def _write_hierarchy_group(self, buf, group_name, parent_name=None):
         """Write a hierarchy group as a Null node
 
-        Returns:
-            list: FBX lines for this group
+        Args:
+            buf: Writable text buffer for FBX output
+            group_name: Sanitized group name
+            parent_name: Optional parent node name for hierarchy
         """
-        lines = []
-
         model_id = self._get_id(f"Model::{group_name}")
         attr_id = self._get_id(f"NodeAttribute::{group_name}")
 
         # Null attribute
-        lines.extend([
+        self._write_lines(buf, [
             f'    NodeAttribute: {attr_id}, "NodeAttribute::{group_name}", "Null" {{',
             '        TypeFlags: "Null"',
             '    }',
         ])
 
         # Null model
-        lines.extend([
+        self._write_lines(buf, [
             f'    Model: {model_id}, "Model::{group_name}", "Null" {{',
             '        Version: 232',
             '        Properties70:  {',
@@ -1316,13 +1398,11 @@ class FBXExporter(BaseExporter):
 
         self._created_groups.add(group_name)
 
-        return lines
-
     # === UTILITIES ===
 
     def _sanitize_name(self, name):
         """Sanitize name for FBX"""
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
+        sanitized = self._SANITIZE_RE.sub('_', name)
         if sanitized and sanitized[0].isdigit():
             sanitized = f"obj_{sanitized}"
         return sanitized or "unnamed"
@@ -12,13 +12,170 @@ Export Strategy:
 Supports both Alembic and USD input files via SceneData.
 """
 
-import re
+import string
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+
+import numpy as np
+
 from exporters.base_exporter import BaseExporter
 from core.scene_data import SceneData, AnimationType
 
 
+def _build_mesh_topology(indices, counts):
+    """Build Maya edge and face-edge arrays from polygon face data
+
+    Edges are numbered in order of first appearance while walking the faces.
+    Face edges follow the reversed winding Maya expects (Alembic uses the
+    opposite convention); an edge traversed against its stored direction is
+    written as -index - 1.
+
+    Args:
+        indices: Flat list of face vertex indices
+        counts: List of vertex counts per face
+
+    Returns:
+        tuple: (edges, face_edges) - int64 arrays of shape (E, 2) and (len(indices),)
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    counts = np.asarray(counts, dtype=np.int64)
+    if indices.size == 0:
+        return np.empty((0, 2), dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    # Position of each face-vertex within its face, and the face start offset
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    sizes = np.repeat(counts, counts)
+    local = np.arange(indices.size) - offsets
+
+    # Forward edge k of a face runs from vertex k to vertex k + 1 (wrapping)
+    starts = indices
+    ends = indices[offsets + (local + 1) % sizes]
+
+    # Undirected edge key, numbered by first occurrence
+    span = int(indices.max()) + 1
+    keys = np.minimum(starts, ends) * span + np.maximum(starts, ends)
+    _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty_like(order)
+    rank[order] = np.arange(order.size)
+    edge_ids = rank[inverse.ravel()]
+    edges = np.column_stack([starts[first[order]], ends[first[order]]])
+
+    # Reversed winding walks forward edge k from vertex k + 1 back to vertex k,
+    # in the order k = c-2, c-3, ..., 0, c-1
+    reversed_edges = np.where(edges[edge_ids, 0] == ends, edge_ids, -edge_ids - 1)
+    face_edges = reversed_edges[offsets + (sizes - 2 - local) % sizes]
+    return edges, face_edges
+
+
+def _quantize_positions(positions):
+    """Snap (N, 3) positions onto a per-mesh 16-bit grid over their bounding box
+
+    Returns:
+        tuple: (dequantized positions, bbox min, bbox max, per-axis decimals)
+    """
+    lo = positions.min(axis=0)
+    hi = positions.max(axis=0)
+    span = hi - lo
+    # Flat axes would divide by zero; any scale maps them onto lo exactly
+    scale = np.where(span > 0, span / 65535.0, 1.0)
+    q = np.round((positions - lo) / scale).astype(np.uint16)
+    # Enough decimals to print within half a grid step of each value (fewer
+    # than %.6f on meshes wider than ~6.6 units, more on tiny ones); flat
+    # axes keep 6 digits, matching the unquantized output
+    decimals = np.where(span > 0, np.clip(np.ceil(-np.log10(scale)), 0, 15), 6)
+    return lo + q * scale, lo, hi, tuple(int(d) for d in decimals)
+
+
+class _SanitizeTable(dict):
+    """str.translate table mapping every char outside [a-zA-Z0-9_] to '_'
+
+    Only the allowed ASCII characters are stored; __missing__ covers the
+    rest, including non-ASCII code points, without a 0x110000-entry table.
+    """
+
+    def __missing__(self, key):
+        return '_'
+
+
+_SANITIZE_TABLE = _SanitizeTable((ord(c), c) for c in string.ascii_letters + string.digits + '_')
+
+
+@lru_cache(maxsize=4096)
+def _sanitize_maya_name(name):
+    """Sanitize name for Maya (cached, names recur across nodes and curves)"""
+    sanitized = name.translate(_SANITIZE_TABLE)
+    if sanitized and sanitized[0].isdigit():
+        sanitized = f"obj_{sanitized}"
+    return sanitized or "unnamed"
+
+
+# Backslashes become forward slashes in MEL paths
+_MEL_PATH_TABLE = str.maketrans({'\\': '/'})
+
+
+@lru_cache(maxsize=1024)
+def _mel_escape(s):
+    """Escape a string for a MEL double-quoted literal (cached, paths repeat per node)"""
+    # The quote escape grows the string, so it stays a separate replace
+    return s.translate(_MEL_PATH_TABLE).replace('"', '\\"')
+
+
+@lru_cache(maxsize=32)
+def _requirements_text(maya_version, has_vertex_anim, source_file_type):
+    """Render the requires section, which has no per-shot content"""
+    lines = [f'requires maya "{maya_version}";']
+    if has_vertex_anim:
+        if source_file_type == 'alembic':
+            lines.append('requires -nodeType "AlembicNode" "AbcImport" "1.0";')
+        else:
+            # USD requires mayaUsdPlugin for USD Stage nodes
+            lines.append('requires -nodeType "mayaUsdProxyShape" "mayaUsdPlugin" "0.1.0";')
+    lines.append('requires "stereoCamera" "10.0";')
+    lines.append("")
+    return "\n".join(lines) + "\n"
+
+
+# createNode templates: (node type, name) and (node type, name, parent)
+_CREATE_NODE = 'createNode %s -n "%s";'
+_CREATE_CHILD_NODE = 'createNode %s -n "%s" -p "%s";'
+
+# First-frame translate/rotate/scale of a transform node
+_INITIAL_TRANSFORM = "\n".join([
+    '    setAttr ".t" -type "double3" %.6f %.6f %.6f;',
+    '    setAttr ".r" -type "double3" %.6f %.6f %.6f;',
+    '    setAttr ".s" -type "double3" %.6f %.6f %.6f;',
+])
+
+# Vertex-animated mesh shape fed by an AlembicNode:
+# (shape, transform, alembic node, escaped .abc path, object path, alembic node, alembic node, shape)
+_ALEMBIC_BLOCK = "\n".join([
+    'createNode mesh -n "%s" -p "%s";',
+    '    setAttr -k off ".v";',
+    '    setAttr ".vir" yes;',
+    '    setAttr ".vif" yes;',
+    'createNode AlembicNode -n "%s";',
+    '    setAttr ".abc_File" -type "string" "%s";',
+    '    setAttr ".objectPath" -type "string" "%s";',
+    'connectAttr "time1.outTime" "%s.time";',
+    'connectAttr "%s.outPolyMesh[0]" "%s.inMesh";',
+])
+
+# Transform channels in (N, 9) keyframe column order: (attr, animCurve type, short name)
+_TRANSFORM_CURVES = (
+    ('translateX', 'TL', 'tx'),
+    ('translateY', 'TL', 'ty'),
+    ('translateZ', 'TL', 'tz'),
+    ('rotateX', 'TA', 'rx'),
+    ('rotateY', 'TA', 'ry'),
+    ('rotateZ', 'TA', 'rz'),
+    ('scaleX', 'TU', 'sx'),
+    ('scaleY', 'TU', 'sy'),
+    ('scaleZ', 'TU', 'sz'),
+)
+
+
 class MayaMAExporter(BaseExporter):
     """Maya ASCII (.ma) file exporter - produces native Maya files"""
 
@@ -28,6 +185,7 @@ class MayaMAExporter(BaseExporter):
         self.shot_name = ""
         self.mesh_shapes = []  # Track mesh shapes for shading connections
         self.created_nodes = set()  # Track nodes we've created (for hierarchy)
+        self.quantize_static_positions = False  # Opt-in 16-bit vertex quantization
 
     def get_format_name(self):
         return "Maya MA"
@@ -60,30 +218,27 @@ class MayaMAExporter(BaseExporter):
             source_format = scene_data.metadata.source_format_name
             source_file_type = 'alembic' if source_format == 'Alembic' else 'usd'
 
-            lines = []
             has_vertex_anim = len(scene_data.animation_categories.vertex_animated) > 0
 
-            # === FILE HEADER ===
-            lines.extend(self._generate_header())
-            lines.extend(self._generate_requirements(has_vertex_anim, source_file_type))
-            lines.extend(self._generate_units(fps, frame_count))
-            lines.extend(self._generate_file_info(source_file_path, source_file_type))
-
-            # === DEFAULT MAYA NODES ===
-            lines.extend(self._generate_default_nodes())
+            # Sections are streamed straight to a buffered file handle
+            with open(ma_file, 'w', encoding='utf-8', buffering=self.WRITE_BUFFER_SIZE) as f:
+                # === FILE HEADER ===
+                self._generate_header(f)
+                self._generate_requirements(f, has_vertex_anim, source_file_type)
+                self._generate_units(f, fps, frame_count)
+                self._generate_file_info(f, source_file_path, source_file_type)
 
-            # === SCENE CONTENT ===
-            lines.extend(self._generate_scene_nodes(scene_data, source_file_path, source_file_type))
+                # === DEFAULT MAYA NODES ===
+                self._generate_default_nodes(f)
 
-            # === SHADING CONNECTIONS ===
-            lines.extend(self._generate_shading_connections())
+                # === SCENE CONTENT ===
+                self._generate_scene_nodes(f, scene_data, source_file_path, source_file_type)
 
-            # === DEFAULT CONNECTIONS ===
-            lines.extend(self._generate_default_connections())
+                # === SHADING CONNECTIONS ===
+                self._generate_shading_connections(f)
 
-            # Write file
-            with open(ma_file, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(lines))
+                # === DEFAULT CONNECTIONS ===
+                self._generate_default_connections(f)
 
             self.log(f"✓ Maya MA file created: {ma_file.name}")
 
@@ -112,42 +267,33 @@ class MayaMAExporter(BaseExporter):
 
     # === HEADER GENERATION ===
 
-    def _generate_header(self):
+    def _generate_header(self, f):
         """Generate Maya .ma file header"""
         timestamp = datetime.now().strftime("%a, %b %d, %Y %I:%M:%S %p")
-        return [
+        self._write_lines(f, [
             f"//Maya ASCII {self.maya_version} scene",
             f"//Name: {self.shot_name}.ma",
             f"//Last modified: {timestamp}",
             "//Codeset: UTF-8",
             ""
-        ]
+        ])
 
-    def _generate_requirements(self, has_vertex_anim=False, source_file_type='alembic'):
+    def _generate_requirements(self, f, has_vertex_anim=False, source_file_type='alembic'):
         """Generate requirements section"""
-        lines = [f'requires maya "{self.maya_version}";']
-        if has_vertex_anim:
-            if source_file_type == 'alembic':
-                lines.append('requires -nodeType "AlembicNode" "AbcImport" "1.0";')
-            else:
-                # USD requires mayaUsdPlugin for USD Stage nodes
-                lines.append('requires -nodeType "mayaUsdProxyShape" "mayaUsdPlugin" "0.1.0";')
-        lines.append('requires "stereoCamera" "10.0";')
-        lines.append("")
-        return lines
+        f.write(_requirements_text(self.maya_version, has_vertex_anim, source_file_type))
 
-    def _generate_units(self, fps, frame_count):
+    def _generate_units(self, f, fps, frame_count):
         """Generate units and playback range"""
-        return [
+        self._write_lines(f, [
             'currentUnit -l centimeter -a degree -t film;',
             'fileInfo "application" "maya";',
             f'fileInfo "product" "Maya {self.maya_version}";',
             f'fileInfo "version" "{self.maya_version}";',
             f'playbackOptions -min 1 -max {frame_count} -ast 1 -aet {frame_count};',
             ""
-        ]
+        ])
 
-    def _generate_file_info(self, source_filename=None, source_file_type='alembic'):
+    def _generate_file_info(self, f, source_filename=None, source_file_type='alembic'):
         """Generate file metadata"""
         lines = []
         if source_filename:
@@ -156,13 +302,13 @@ class MayaMAExporter(BaseExporter):
             else:
                 lines.append(f'fileInfo "sourceUSD" "{self._mel_escape_string(source_filename)}";')
         lines.append("")
-        return lines
+        self._write_lines(f, lines)
 
     # === DEFAULT MAYA NODES ===
 
-    def _generate_default_nodes(self):
+    def _generate_default_nodes(self, f):
         """Generate default Maya scene nodes"""
-        return [
+        self._write_lines(f, [
             '// Default Maya nodes',
             'createNode transform -s -n "persp";',
             '    setAttr ".t" -type "double3" 28 21 28;',
@@ -231,11 +377,11 @@ class MayaMAExporter(BaseExporter):
             'createNode materialInfo -n "initialMaterialInfo";',
             'createNode lambert -n "lambert1" -s;',
             '',
-        ]
+        ])
 
     # === SCENE GENERATION ===
 
-    def _generate_scene_nodes(self, scene_data: SceneData, source_file_path, source_file_type):
+    def _generate_scene_nodes(self, f, scene_data: SceneData, source_file_path, source_file_type):
         """Generate all scene content nodes from SceneData
 
         Reconstructs the original scene hierarchy by:
@@ -243,7 +389,7 @@ class MayaMAExporter(BaseExporter):
         2. Creating intermediate group nodes first
         3. Creating cameras, meshes, and locators with proper parenting
         """
-        lines = ['// Scene content', '']
+        self._write_lines(f, ['// Scene content', ''])
 
         # Build hierarchy map from full paths
         hierarchy_map = self._build_hierarchy_map(scene_data)
@@ -251,21 +397,18 @@ class MayaMAExporter(BaseExporter):
         # Create intermediate hierarchy groups first (parents before children)
         hierarchy_groups = self._get_hierarchy_groups(scene_data)
         if hierarchy_groups:
-            lines.append('// Hierarchy groups')
+            f.write('// Hierarchy groups\n')
             for group_name, parent_name in hierarchy_groups:
                 if group_name not in self.created_nodes:
                     # Ensure parent exists if specified and not yet created
                     if parent_name and parent_name not in self.created_nodes:
-                        lines.append(f'createNode transform -n "{parent_name}";')
+                        f.write(_CREATE_NODE % ('transform', parent_name) + '\n')
                         self.created_nodes.add(parent_name)
 
-                    if parent_name and parent_name in self.created_nodes:
-                        lines.append(f'createNode transform -n "{group_name}" -p "{parent_name}";')
-                    else:
-                        lines.append(f'createNode transform -n "{group_name}";')
+                    f.write(self._create_transform(group_name, parent_name) + '\n')
                     self.created_nodes.add(group_name)
                     self.log(f"  Creating hierarchy group: {group_name}")
-            lines.append('')
+            f.write('\n')
 
         # Process cameras
         for cam in scene_data.cameras:
@@ -277,9 +420,12 @@ class MayaMAExporter(BaseExporter):
             parent = self._get_node_parent(cam.full_path, hierarchy_map)
 
             self.log(f"  Processing camera: {cam_name}" + (f" (parent: {parent})" if parent else ""))
-            lines.extend(self._export_camera(cam, cam_name, parent))
+            self._export_camera(f, cam, cam_name, parent)
             self.created_nodes.add(cam_name)
-            lines.append('')
+            f.write('\n')
+
+        # The source path is shared by every vertex-animated mesh reference
+        escaped_source_path = self._mel_escape_string(source_file_path) if source_file_path else None
 
         # Process meshes
         for mesh in scene_data.meshes:
@@ -292,15 +438,16 @@ class MayaMAExporter(BaseExporter):
 
             if mesh.animation_type == AnimationType.VERTEX_ANIMATED:
                 self.log(f"  Processing vertex-animated mesh: {mesh_name}" + (f" (parent: {parent})" if parent else ""))
-                lines.extend(self._export_vertex_animated_mesh(
-                    mesh, mesh_name, source_file_path, source_file_type, parent
-                ))
+                self._export_vertex_animated_mesh(
+                    f, mesh, mesh_name, source_file_path, source_file_type, parent,
+                    escaped_source_path
+                )
             else:
                 self.log(f"  Processing mesh: {mesh_name}" + (f" (parent: {parent})" if parent else ""))
                 is_animated = mesh.animation_type == AnimationType.TRANSFORM_ONLY
-                lines.extend(self._export_static_mesh(mesh, mesh_name, is_animated, parent))
+                self._export_static_mesh(f, mesh, mesh_name, is_animated, parent)
             self.created_nodes.add(mesh_name)
-            lines.append('')
+            f.write('\n')
 
         # Process transforms (locators/trackers)
         for transform in scene_data.transforms:
@@ -314,13 +461,11 @@ class MayaMAExporter(BaseExporter):
             parent = self._get_node_parent(transform.full_path, hierarchy_map)
 
             self.log(f"  Processing locator: {xform_name}" + (f" (parent: {parent})" if parent else ""))
-            lines.extend(self._export_locator(transform, xform_name, parent))
+            self._export_locator(f, transform, xform_name, parent)
             self.created_nodes.add(xform_name)
-            lines.append('')
+            f.write('\n')
 
-        return lines
-
-    def _export_camera(self, cam_data, cam_name, parent_name=None):
+    def _export_camera(self, f, cam_data, cam_name, parent_name=None):
         """Export camera with animation from CameraData
 
         Args:
@@ -331,10 +476,7 @@ class MayaMAExporter(BaseExporter):
         lines = []
 
         # Create transform (with parent if specified)
-        if parent_name and parent_name in self.created_nodes:
-            lines.append(f'createNode transform -n "{cam_name}" -p "{parent_name}";')
-        else:
-            lines.append(f'createNode transform -n "{cam_name}";')
+        lines.append(self._create_transform(cam_name, parent_name))
 
         # Get camera properties
         focal_length = cam_data.properties.focal_length
@@ -345,7 +487,7 @@ class MayaMAExporter(BaseExporter):
         # Create camera shape
         shape_name = f"{cam_name}Shape"
         lines.extend([
-            f'createNode camera -n "{shape_name}" -p "{cam_name}";',
+            _CREATE_CHILD_NODE % ('camera', shape_name, cam_name),
             f'    setAttr -k off ".v";',
             f'    setAttr ".fl" {focal_length};',
             f'    setAttr ".coi" 5;',
@@ -356,12 +498,77 @@ class MayaMAExporter(BaseExporter):
             f'    setAttr ".vfa" {v_aperture};',
         ])
 
+        self._write_lines(f, lines)
+
         # Add animation from keyframes
-        lines.extend(self._animate_transform_from_keyframes(cam_data.keyframes, cam_name))
+        self._animate_transform_from_keyframes(f, cam_data.keyframes, cam_name)
 
-        return lines
+    def _format_mesh_data(self, mesh_data):
+        """Format the setAttr ".o" -type "mesh" payload for a mesh
 
-    def _export_static_mesh(self, mesh_data, mesh_name, is_animated, parent_name=None):
+        Args:
+            mesh_data: MeshData from SceneData
+
+        Returns:
+            tuple: (payload, bbox) where payload is the vertex, normal, edge
+                and face data in Maya mesh format and bbox is the (min, max)
+                quantization box, or None when positions are not quantized
+        """
+        # Get mesh geometry from SceneData
+        positions = mesh_data.geometry.positions
+        indices = mesh_data.geometry.indices
+        counts = mesh_data.geometry.counts
+
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        num_verts = len(positions)
+
+        # Build edges from face data
+        edges, face_edges = _build_mesh_topology(indices, counts)
+        num_edges = len(edges)
+
+        # Build the mesh data in official Maya format using setAttr -type mesh.
+        # Each section is formatted with a single %-template over its values.
+        mesh_data_parts = []
+
+        # Vertices: "v" count x y z x y z ...
+        bbox = None
+        mesh_data_parts.append(f'"v" {num_verts}')
+        if num_verts:
+            if self.quantize_static_positions:
+                # Digits finer than the 16-bit grid step would only be noise
+                positions, lo, hi, decimals = _quantize_positions(positions)
+                bbox = (lo, hi)
+                vertex_template = "%%.%df %%.%df %%.%df" % decimals
+            else:
+                vertex_template = "%.6f %.6f %.6f"
+            mesh_data_parts.append(
+                " ".join([vertex_template] * num_verts) % tuple(positions.ravel().tolist()))
+
+        # Vertex normals: "vn" 0 (required, set to 0)
+        mesh_data_parts.append('"vn" 0')
+
+        # Edges: "e" count v1 v2 "smooth" v1 v2 "smooth" ...
+        mesh_data_parts.append(f'"e" {num_edges}')
+        if num_edges:
+            mesh_data_parts.append(
+                " ".join(['%d %d "smooth"'] * num_edges) % tuple(edges.ravel().tolist()))
+
+        # Faces: "face" "l" edgeCount edge1 edge2 ... "face" "l" ...
+        if len(counts):
+            template = " ".join(['"face" "l" %d' + ' %d' * count for count in counts])
+            # Interleave each face's edge count ahead of its edge indices
+            counts_arr = np.asarray(counts, dtype=np.int64)
+            values = np.empty(face_edges.size + counts_arr.size, dtype=np.int64)
+            count_slots = np.cumsum(counts_arr) - counts_arr + np.arange(counts_arr.size)
+            is_count = np.zeros(values.size, dtype=bool)
+            is_count[count_slots] = True
+            values[is_count] = counts_arr
+            values[~is_count] = face_edges
+            mesh_data_parts.append(template % tuple(values.tolist()))
+
+        return " ".join(mesh_data_parts), bbox
+
+    def _export_static_mesh(self, f, mesh_data, mesh_name, is_animated, parent_name=None):
         """Export mesh with native Maya geometry from MeshData
 
         Args:
@@ -373,105 +580,47 @@ class MayaMAExporter(BaseExporter):
         lines = []
 
         # Create transform (with parent if specified)
-        if parent_name and parent_name in self.created_nodes:
-            lines.append(f'createNode transform -n "{mesh_name}" -p "{parent_name}";')
-        else:
-            lines.append(f'createNode transform -n "{mesh_name}";')
+        lines.append(self._create_transform(mesh_name, parent_name))
 
         # Set initial transform values from first keyframe (using Maya-compatible rotation)
         if mesh_data.keyframes:
             kf = mesh_data.keyframes[0]
-            pos = kf.position
-            rot = kf.rotation_maya  # Use Maya-compatible rotation
-            scale = kf.scale
-            lines.append(f'    setAttr ".t" -type "double3" {pos[0]:.6f} {pos[1]:.6f} {pos[2]:.6f};')
-            lines.append(f'    setAttr ".r" -type "double3" {rot[0]:.6f} {rot[1]:.6f} {rot[2]:.6f};')
-            lines.append(f'    setAttr ".s" -type "double3" {scale[0]:.6f} {scale[1]:.6f} {scale[2]:.6f};')
-
-        # Get mesh geometry from SceneData
-        positions = mesh_data.geometry.positions
-        indices = mesh_data.geometry.indices
-        counts = mesh_data.geometry.counts
+            lines.append(_INITIAL_TRANSFORM % (
+                *kf.position[:3], *kf.rotation_maya[:3], *kf.scale[:3]))
 
         # Create mesh shape
         shape_name = f"{mesh_name}Shape"
         self.mesh_shapes.append(shape_name)
 
-        lines.append(f'createNode mesh -n "{shape_name}" -p "{mesh_name}";')
+        lines.append(_CREATE_CHILD_NODE % ('mesh', shape_name, mesh_name))
         lines.append(f'    setAttr -k off ".v";')
         lines.append(f'    setAttr ".vir" yes;')
         lines.append(f'    setAttr ".vif" yes;')
 
-        num_verts = len(positions)
-        num_faces = len(counts)
-
-        # Build edges from face data
-        edges = []
-        edge_map = {}
-        idx_offset = 0
-
-        for count in counts:
-            face_verts = [indices[idx_offset + i] for i in range(count)]
-            for i in range(count):
-                v1, v2 = face_verts[i], face_verts[(i + 1) % count]
-                edge_key = (min(v1, v2), max(v1, v2))
-                if edge_key not in edge_map:
-                    edge_map[edge_key] = len(edges)
-                    edges.append((v1, v2))
-            idx_offset += count
-
-        num_edges = len(edges)
-
-        # Build the mesh data in official Maya format using setAttr -type mesh
-        mesh_data_parts = []
-
-        # Vertices: "v" count x y z x y z ...
-        mesh_data_parts.append(f'"v" {num_verts}')
-        for pos in positions:
-            mesh_data_parts.append(f'{pos[0]:.6f} {pos[1]:.6f} {pos[2]:.6f}')
-
-        # Vertex normals: "vn" 0 (required, set to 0)
-        mesh_data_parts.append('"vn" 0')
+        # Formatted before the shape lines are written, since the bbox
+        # comment is only known afterwards and must precede the setAttr
+        mesh_block, bbox = self._format_mesh_data(mesh_data)
 
-        # Edges: "e" count v1 v2 "smooth" v1 v2 "smooth" ...
-        mesh_data_parts.append(f'"e" {num_edges}')
-        for v1, v2 in edges:
-            mesh_data_parts.append(f'{v1} {v2} "smooth"')
+        # Record the quantization bounding box so tooling can verify the grid
+        if bbox is not None:
+            # Full round-trip precision, so the grid can be rebuilt exactly
+            lines.append('    // bbox min %.17g %.17g %.17g max %.17g %.17g %.17g' % (*bbox[0], *bbox[1]))
 
-        # Faces: "face" "l" edgeCount edge1 edge2 ... "face" "l" ...
-        idx_offset = 0
-        for face_idx, count in enumerate(counts):
-            face_verts = [indices[idx_offset + i] for i in range(count)]
-            # Reverse winding order - Alembic uses opposite convention from Maya
-            face_verts.reverse()
-
-            # Get edge indices for this face
-            face_edges = []
-            for i in range(count):
-                v1, v2 = face_verts[i], face_verts[(i + 1) % count]
-                edge_key = (min(v1, v2), max(v1, v2))
-                edge_idx = edge_map[edge_key]
-                # Check edge direction - negative means reversed
-                if edges[edge_idx][0] == v1:
-                    face_edges.append(edge_idx)
-                else:
-                    face_edges.append(-edge_idx - 1)
-
-            edge_str = ' '.join(str(e) for e in face_edges)
-            mesh_data_parts.append(f'"face" "l" {count} {edge_str}')
-            idx_offset += count
-
-        # Write mesh data as single setAttr command
+        # A single setAttr command, written as the attribute line, the indented
+        # payload and the closing ';' so the payload is never copied into a
+        # larger string
         lines.append(f'    setAttr ".o" -type "mesh"')
-        lines.append(f'        {" ".join(mesh_data_parts)};')
+        self._write_lines(f, lines)
+        f.write('        ')
+        f.write(mesh_block)
+        f.write(';\n')
 
         # Animate transform if needed
         if is_animated:
-            lines.extend(self._animate_transform_from_keyframes(mesh_data.keyframes, mesh_name))
-
-        return lines
+            self._animate_transform_from_keyframes(f, mesh_data.keyframes, mesh_name)
 
-    def _export_vertex_animated_mesh(self, mesh_data, mesh_name, source_file_path, source_file_type, parent_name=None):
+    def _export_vertex_animated_mesh(self, f, mesh_data, mesh_name, source_file_path, source_file_type,
+                                     parent_name=None, escaped_source_path=None):
         """Export vertex-animated mesh via source file reference
 
         For Alembic sources: Creates AlembicNode reference
@@ -483,41 +632,36 @@ class MayaMAExporter(BaseExporter):
             source_file_path: Path to source file
             source_file_type: 'alembic' or 'usd'
             parent_name: Optional parent node name for hierarchy
+            escaped_source_path: source_file_path already MEL-escaped by the caller
         """
-        lines = []
-
         # Create transform (with parent if specified)
-        if parent_name and parent_name in self.created_nodes:
-            lines.append(f'createNode transform -n "{mesh_name}" -p "{parent_name}";')
-        else:
-            lines.append(f'createNode transform -n "{mesh_name}";')
+        lines = [self._create_transform(mesh_name, parent_name)]
 
         shape_name = f"{mesh_name}Shape"
         self.mesh_shapes.append(shape_name)
 
-        lines.extend([
-            f'createNode mesh -n "{shape_name}" -p "{mesh_name}";',
-            f'    setAttr -k off ".v";',
-            f'    setAttr ".vir" yes;',
-            f'    setAttr ".vif" yes;',
-        ])
+        if source_file_path and escaped_source_path is None:
+            escaped_source_path = self._mel_escape_string(source_file_path)
 
-        if source_file_path:
-            if source_file_type == 'alembic':
-                # Alembic source: Use AlembicNode for vertex animation
-                alembic_node = f"{mesh_name}_AlembicNode"
-                lines.extend([
-                    f'createNode AlembicNode -n "{alembic_node}";',
-                    f'    setAttr ".abc_File" -type "string" "{self._mel_escape_string(source_file_path)}";',
-                    f'    setAttr ".objectPath" -type "string" "{mesh_data.full_path}";',
-                    f'connectAttr "time1.outTime" "{alembic_node}.time";',
-                    f'connectAttr "{alembic_node}.outPolyMesh[0]" "{shape_name}.inMesh";',
-                ])
-            else:
+        if source_file_path and source_file_type == 'alembic':
+            # Alembic source: Use AlembicNode for vertex animation
+            alembic_node = f"{mesh_name}_AlembicNode"
+            lines.append(_ALEMBIC_BLOCK % (
+                shape_name, mesh_name, alembic_node, escaped_source_path,
+                mesh_data.full_path, alembic_node, alembic_node, shape_name,
+            ))
+        else:
+            lines.extend([
+                _CREATE_CHILD_NODE % ('mesh', shape_name, mesh_name),
+                '    setAttr -k off ".v";',
+                '    setAttr ".vir" yes;',
+                '    setAttr ".vif" yes;',
+            ])
+            if source_file_path:
                 # USD source: Add comment noting manual setup required
                 lines.extend([
                     f'// NOTE: Vertex-animated mesh "{mesh_name}" requires manual USD Stage setup',
-                    f'// Source USD file: {self._mel_escape_string(source_file_path)}',
+                    f'// Source USD file: {escaped_source_path}',
                     f'// Object path: {mesh_data.full_path}',
                     f'// To connect vertex animation:',
                     f'//   1. Load mayaUsdPlugin',
@@ -525,9 +669,9 @@ class MayaMAExporter(BaseExporter):
                     f'//   3. Connect appropriate USD prim to this mesh',
                 ])
 
-        return lines
+        self._write_lines(f, lines)
 
-    def _export_locator(self, transform_data, locator_name, parent_name=None):
+    def _export_locator(self, f, transform_data, locator_name, parent_name=None):
         """Export locator with animation from TransformData
 
         Creates a Maya locator node with animated transform.
@@ -536,91 +680,98 @@ class MayaMAExporter(BaseExporter):
             transform_data: TransformData from SceneData
             locator_name: Sanitized name for the locator
             parent_name: Optional parent node name for hierarchy
-
-        Returns:
-            list: Maya ASCII lines for this locator
         """
         lines = []
 
         # Create transform (with parent if specified)
-        if parent_name and parent_name in self.created_nodes:
-            lines.append(f'createNode transform -n "{locator_name}" -p "{parent_name}";')
-        else:
-            lines.append(f'createNode transform -n "{locator_name}";')
+        lines.append(self._create_transform(locator_name, parent_name))
 
         # Set initial transform values from first keyframe (using Maya-compatible rotation)
         if transform_data.keyframes:
             kf = transform_data.keyframes[0]
-            pos = kf.position
-            rot = kf.rotation_maya  # Use Maya-compatible rotation
-            scale = kf.scale
-            lines.append(f'    setAttr ".t" -type "double3" {pos[0]:.6f} {pos[1]:.6f} {pos[2]:.6f};')
-            lines.append(f'    setAttr ".r" -type "double3" {rot[0]:.6f} {rot[1]:.6f} {rot[2]:.6f};')
-            lines.append(f'    setAttr ".s" -type "double3" {scale[0]:.6f} {scale[1]:.6f} {scale[2]:.6f};')
+            lines.append(_INITIAL_TRANSFORM % (
+                *kf.position[:3], *kf.rotation_maya[:3], *kf.scale[:3]))
 
         # Create locator shape
         shape_name = f"{locator_name}Shape"
         lines.extend([
-            f'createNode locator -n "{shape_name}" -p "{locator_name}";',
+            _CREATE_CHILD_NODE % ('locator', shape_name, locator_name),
             f'    setAttr -k off ".v";',
         ])
 
-        # Add animation from keyframes
-        lines.extend(self._animate_transform_from_keyframes(transform_data.keyframes, locator_name))
+        self._write_lines(f, lines)
 
-        return lines
+        # Add animation from keyframes
+        self._animate_transform_from_keyframes(f, transform_data.keyframes, locator_name)
 
-    def _animate_transform_from_keyframes(self, keyframes, node_name):
+    def _animate_transform_from_keyframes(self, f, keyframes, node_name):
         """Create animation curves from pre-extracted keyframes"""
-        lines = []
-
         if not keyframes:
-            return lines
-
-        # Extract values from keyframes (using Maya-compatible rotation)
-        times = [kf.frame for kf in keyframes]
-        tx = [kf.position[0] for kf in keyframes]
-        ty = [kf.position[1] for kf in keyframes]
-        tz = [kf.position[2] for kf in keyframes]
-        rx = [kf.rotation_maya[0] for kf in keyframes]
-        ry = [kf.rotation_maya[1] for kf in keyframes]
-        rz = [kf.rotation_maya[2] for kf in keyframes]
-        sx = [kf.scale[0] for kf in keyframes]
-        sy = [kf.scale[1] for kf in keyframes]
-        sz = [kf.scale[2] for kf in keyframes]
-
-        def is_animated(vals):
-            return len(set(round(v, 6) for v in vals)) > 1
-
-        curves = [
-            ('translateX', 'TL', 'tx', tx),
-            ('translateY', 'TL', 'ty', ty),
-            ('translateZ', 'TL', 'tz', tz),
-            ('rotateX', 'TA', 'rx', rx),
-            ('rotateY', 'TA', 'ry', ry),
-            ('rotateZ', 'TA', 'rz', rz),
-            ('scaleX', 'TU', 'sx', sx),
-            ('scaleY', 'TU', 'sy', sy),
-            ('scaleZ', 'TU', 'sz', sz),
-        ]
-
-        for attr, curve_type, short, vals in curves:
-            if is_animated(vals):
-                curve_name = f"{node_name}_{attr}"
-                lines.append(f'createNode animCurve{curve_type} -n "{curve_name}";')
-                lines.append(f'    setAttr ".tan" 18;')
-                lines.append(f'    setAttr ".wgt" no;')
-                lines.append(f'    setAttr -s {len(times)} ".ktv[0:{len(times)-1}]"')
-                for i, (t, v) in enumerate(zip(times, vals)):
-                    suffix = ';' if i == len(times) - 1 else ''
-                    lines.append(f'        {t} {v:.6f}{suffix}')
-                lines.append(f'connectAttr "{curve_name}.o" "{node_name}.{short}";')
-
-        return lines
+            return
+
+        # Gather all nine channels into one (N, 9) array (using Maya-compatible rotation)
+        count = len(keyframes)
+        times = np.fromiter((kf.frame for kf in keyframes), dtype=np.float64, count=count)
+        data = np.empty((count, 9), dtype=np.float64)
+        for row, kf in enumerate(keyframes):
+            data[row, 0:3] = kf.position
+            data[row, 3:6] = kf.rotation_maya
+            data[row, 6:9] = kf.scale
+
+        # A channel is animated when it moves by more than the written precision
+        animated = (np.ptp(data, axis=0) > 1e-6).tolist()
+
+        for column, (attr, curve_type, short) in enumerate(_TRANSFORM_CURVES):
+            if animated[column]:
+                self._create_anim_curve(f, node_name, attr, curve_type, short,
+                                        times, data[:, column])
+
+    def _create_anim_curve(self, f, node_name, attr, curve_type, short, times, values):
+        """Write one animCurve node with its keys and connect it to node_name.attr
+
+        Args:
+            f: Open file to write to
+            node_name: Animated transform node
+            attr: Long attribute name, used in the curve node name
+            curve_type: animCurve suffix (TL, TA or TU)
+            short: Short attribute name to connect to
+            times: Key frame numbers
+            values: Key values, same length as times
+
+        Interior keys of constant runs are omitted; the written key count
+        and .ktv range reflect only the keys that are kept.
+        """
+        curve_name = f"{node_name}_{attr}"
+
+        # Curves use Auto tangents (.tan 18), which clamp flat on a key equal
+        # to a neighbour. Both ends of a held run therefore stay flat and the
+        # segment between them is constant, so its interior keys can be dropped
+        values = np.asarray(values, dtype=np.float64)
+        keep = np.ones(values.size, dtype=bool)
+        keep[1:-1] = (values[1:-1] != values[:-2]) | (values[1:-1] != values[2:])
+        times = np.asarray(times, dtype=np.float64)[keep]
+        values = values[keep]
+
+        key_count = len(times)
+        keys = np.column_stack((times, values)).ravel().tolist()
+        self._write_lines(f, [
+            _CREATE_NODE % ('animCurve' + curve_type, curve_name),
+            f'    setAttr ".tan" 18;',
+            f'    setAttr ".wgt" no;',
+            f'    setAttr -s {key_count} ".ktv[0:{key_count - 1}]"',
+            "\n".join(["        %d %.6f"] * key_count) % tuple(keys) + ";",
+            f'connectAttr "{curve_name}.o" "{node_name}.{short}";',
+        ])
 
     # === SHADING CONNECTIONS ===
 
-    def _generate_shading_connections(self):
+    def _create_transform(self, name, parent_name=None):
+        """Build the createNode line for a transform, parented if the parent exists"""
+        if parent_name and parent_name in self.created_nodes:
+            return _CREATE_CHILD_NODE % ('transform', name, parent_name)
+        return _CREATE_NODE % ('transform', name)
+
+    def _generate_shading_connections(self, f):
         """Connect meshes to default shading group"""
         lines = ['// Shading connections', '']
 
@@ -628,11 +779,11 @@ class MayaMAExporter(BaseExporter):
             lines.append(f'connectAttr "{shape}.iog" ":initialShadingGroup.dsm" -na;')
 
         lines.append('')
-        return lines
+        self._write_lines(f, lines)
 
-    def _generate_default_connections(self):
+    def _generate_default_connections(self, f):
         """Generate default Maya scene connections"""
-        return [
+        self._write_lines(f, [
             '// Default connections',
             'connectAttr "layerManager.dli[0]" "defaultLayer.id";',
             'connectAttr "renderLayerManager.rlmi[0]" "defaultRenderLayer.rlid";',
@@ -643,7 +794,7 @@ class MayaMAExporter(BaseExporter):
             'connectAttr "initialShadingGroup.msg" "initialMaterialInfo.sg";',
             'connectAttr "lambert1.msg" "initialMaterialInfo.m";',
             '// End of file',
-        ]
+        ])
 
     # === HIERARCHY UTILITIES ===
 
@@ -777,15 +928,10 @@ class MayaMAExporter(BaseExporter):
 
     def _sanitize_name(self, name):
         """Sanitize name for Maya"""
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        if sanitized and sanitized[0].isdigit():
-            sanitized = f"obj_{sanitized}"
-        return sanitized or "unnamed"
+        return _sanitize_maya_name(name)
 
     def _mel_escape_string(self, s):
         """Escape string for MEL"""
         if s is None:
             return ""
-        s = str(s).replace('\\', '/')
-        s = s.replace('"', '\\"')
-        return s
+        return _mel_escape(str(s))
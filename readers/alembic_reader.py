@@ -4,6 +4,7 @@ Alembic Reader Module
 Centralized Alembic reading utilities implementing the BaseReader interface
 """
 
+import math
 import numpy as np
 from pathlib import Path
 
@@ -12,9 +13,64 @@ from alembic.Abc import IArchive, ISampleSelector, WrapExistingFlag
 from alembic.AbcGeom import IXform, ICamera, IPolyMesh
 import imath
 
+from core.numba_support import njit, prange, NUMBA_AVAILABLE
 from .base_reader import BaseReader
 
 
+@njit(parallel=True, fastmath=True, cache=True)
+def _decompose_matrices_jit(m, maya_compat, translations, rotations, scales):
+    """Numba kernel for AlembicReader._decompose_matrices
+
+    Scalar per-matrix version of the vectorized NumPy decomposition, run in
+    parallel over the matrix stack. Results are written into the (N, 3)
+    output arrays.
+    """
+    for i in prange(m.shape[0]):
+        # Translation (row 3) and scale (row lengths)
+        for r in range(3):
+            translations[i, r] = m[i, 3, r]
+            scales[i, r] = math.sqrt(m[i, r, 0] * m[i, r, 0] +
+                                     m[i, r, 1] * m[i, r, 1] +
+                                     m[i, r, 2] * m[i, r, 2])
+
+        # Normalized rotation rows (rows with zero length are left as-is)
+        d0 = scales[i, 0] if scales[i, 0] > 0 else 1.0
+        d1 = scales[i, 1] if scales[i, 1] > 0 else 1.0
+        d2 = scales[i, 2] if scales[i, 2] > 0 else 1.0
+        r00 = m[i, 0, 0] / d0
+        r01 = m[i, 0, 1] / d0
+        r02 = m[i, 0, 2] / d0
+        r10 = m[i, 1, 0] / d1
+        r11 = m[i, 1, 1] / d1
+        r12 = m[i, 1, 2] / d1
+        r20 = m[i, 2, 0] / d2
+        r21 = m[i, 2, 1] / d2
+        r22 = m[i, 2, 2] / d2
+
+        if maya_compat:
+            cy = math.sqrt(r00 * r00 + r01 * r01)
+            if cy > 1e-6:
+                x = math.atan2(r12, r22)
+                z = math.atan2(-r01, r00)
+            else:
+                x = math.atan2(-r21, r11)
+                z = 0.0
+            y = math.atan2(-r02, cy)
+        else:
+            sy_test = math.sqrt(r00 * r00 + r10 * r10)
+            if sy_test > 1e-6:
+                x = math.atan2(r21, r22)
+                z = math.atan2(r10, r00)
+            else:
+                x = math.atan2(-r12, r11)
+                z = 0.0
+            y = math.atan2(-r20, sy_test)
+
+        rotations[i, 0] = math.degrees(x)
+        rotations[i, 1] = math.degrees(y)
+        rotations[i, 2] = math.degrees(z)
+
+
 class AlembicReader(BaseReader):
     """Centralized Alembic file reading and data extraction
 
@@ -59,14 +115,21 @@ class AlembicReader(BaseReader):
         """
         if self._objects_cache is None:
             self._objects_cache = []
-            self._collect_objects_recursive(self.top, self._objects_cache)
+            self._collect_objects(self.top, self._objects_cache)
         return self._objects_cache
 
-    def _collect_objects_recursive(self, obj, objects_list):
-        """Recursively collect all objects in hierarchy"""
-        objects_list.append(obj)
-        for child in obj.children:
-            self._collect_objects_recursive(child, objects_list)
+    def _collect_objects(self, root, objects_list):
+        """Collect all objects in hierarchy (depth-first, parents before children)
+
+        Uses an explicit stack instead of recursion so deep hierarchies don't
+        pay a Python call frame per node or hit the recursion limit.
+        """
+        stack = [root]
+        while stack:
+            obj = stack.pop()
+            objects_list.append(obj)
+            # Push children reversed so they are visited in their original order
+            stack.extend(reversed(list(obj.children)))
 
     def get_cameras(self):
         """Get all camera objects in the scene
@@ -80,6 +143,13 @@ class AlembicReader(BaseReader):
                 cameras.append(obj)
         return cameras
 
+    def _find_first_camera(self):
+        """Get the first camera in hierarchy order, or None if there is none"""
+        for obj in self.get_all_objects():
+            if ICamera.matches(obj.getHeader()):
+                return obj
+        return None
+
     def get_meshes(self):
         """Get all mesh objects in the scene
 
@@ -159,24 +229,82 @@ class AlembicReader(BaseReader):
                 - rotation: [rx, ry, rz] in degrees (XYZ Euler)
                 - scale: [sx, sy, sz] as multipliers (NOT multiplied by 100)
         """
-        # First, get the LOCAL matrix of this object to extract scale
-        local_scale = None
-        if IXform.matches(obj.getHeader()):
-            xform = IXform(obj, WrapExistingFlag.kWrapExisting)
-            schema = xform.getSchema()
+        local_matrix, world_matrix = self._sample_matrices(obj, time_seconds)
 
-            sample_sel = ISampleSelector(time_seconds)
-            xf_sample = schema.getValue(sample_sel)
-            local_matrix = xf_sample.getMatrix()
+        # Decompose world matrix for position and rotation
+        pos, rot, world_scale = self._decompose_matrix(world_matrix, maya_compat=maya_compat)
+
+        # Use local scale (from the object's own matrix), not world scale
+        # This prevents parent scales from affecting the object's scale
+        final_scale = self._local_scale(local_matrix) if local_matrix is not None else world_scale
+
+        return pos, rot, final_scale
+
+    def get_keyframe_transform_at_time(self, obj, time_seconds):
+        """Get transform data with both rotation decompositions at a specific time
+
+        Samples the xform hierarchy once and decomposes the same world matrix
+        for both rotation modes, instead of calling get_transform_at_time twice.
+
+        Args:
+            obj: Alembic object (should be IXform or have parent IXform)
+            time_seconds: Time in seconds to sample
+
+        Returns:
+            tuple: (translation, rotation_ae, rotation_maya, scale)
+        """
+        local_matrix, world_matrix = self._sample_matrices(obj, time_seconds)
+
+        m = np.asarray(world_matrix, dtype=np.float64)
+        pos, rot_ae, world_scale = self._decompose_matrix(m, maya_compat=False)
+        _, rot_maya, _ = self._decompose_matrix(m, maya_compat=True)
+
+        final_scale = self._local_scale(local_matrix) if local_matrix is not None else world_scale
+
+        return pos, rot_ae, rot_maya, final_scale
+
+    def is_transform_constant(self, obj):
+        """Check whether every xform in the object's parent chain is constant
+
+        Args:
+            obj: Alembic object (should be IXform or have parent IXform)
+
+        Returns:
+            bool: True if no xform affecting obj has more than one distinct sample
+        """
+        current = obj
+
+        while current:
+            if IXform.matches(current.getHeader()):
+                xform = IXform(current, WrapExistingFlag.kWrapExisting)
+                if not xform.getSchema().isConstant():
+                    return False
+
+            parent = current.getParent()
+            if parent and parent.getName() != "ABC":
+                current = parent
+            else:
+                break
+
+        return True
+
+    def _sample_matrices(self, obj, time_seconds):
+        """Sample the local matrix and accumulated world matrix of an object
+
+        Each xform in the parent chain is sampled exactly once. The object's
+        own matrix (first in the chain) doubles as the local matrix for scale.
+
+        Args:
+            obj: Alembic object (should be IXform or have parent IXform)
+            time_seconds: Time in seconds to sample
 
-            # Extract scale from LOCAL matrix (this is where SynthEyes stores it)
-            m = np.array(local_matrix)
-            sx = np.linalg.norm([m[0][0], m[0][1], m[0][2]])
-            sy = np.linalg.norm([m[1][0], m[1][1], m[1][2]])
-            sz = np.linalg.norm([m[2][0], m[2][1], m[2][2]])
-            local_scale = [sx, sy, sz]
+        Returns:
+            tuple: (local_matrix, world_matrix) where local_matrix is None if
+                   obj is not itself an IXform
+        """
+        sample_sel = ISampleSelector(time_seconds)
 
-        # Now accumulate world matrix for position and rotation
+        # Accumulate world matrix for position and rotation
         matrices = []
         current = obj
 
@@ -185,7 +313,6 @@ class AlembicReader(BaseReader):
                 xform = IXform(current, WrapExistingFlag.kWrapExisting)
                 schema = xform.getSchema()
 
-                sample_sel = ISampleSelector(time_seconds)
                 xf_sample = schema.getValue(sample_sel)
                 matrices.append(xf_sample.getMatrix())
 
@@ -195,6 +322,11 @@ class AlembicReader(BaseReader):
             else:
                 break
 
+        # The object's own matrix is where SynthEyes stores per-object scale
+        local_matrix = None
+        if matrices and IXform.matches(obj.getHeader()):
+            local_matrix = matrices[0]
+
         # Combine transforms for world matrix
         world_matrix = imath.M44d()
         world_matrix.makeIdentity()
@@ -202,14 +334,12 @@ class AlembicReader(BaseReader):
         for mat in reversed(matrices):
             world_matrix = world_matrix * mat
 
-        # Decompose world matrix for position and rotation
-        pos, rot, world_scale = self._decompose_matrix(world_matrix, maya_compat=maya_compat)
+        return local_matrix, world_matrix
 
-        # Use local scale (from the object's own matrix), not world scale
-        # This prevents parent scales from affecting the object's scale
-        final_scale = local_scale if local_scale is not None else world_scale
-
-        return pos, rot, final_scale
+    def _local_scale(self, local_matrix):
+        """Extract [sx, sy, sz] from the row lengths of a local matrix"""
+        m = np.asarray(local_matrix, dtype=np.float64)
+        return np.linalg.norm(m[:3, :3], axis=1).tolist()
 
     def get_mesh_data_at_time(self, mesh_obj, time_seconds):
         """Get mesh geometry data at a specific time
@@ -276,16 +406,7 @@ class AlembicReader(BaseReader):
         """
         try:
             # Search for camera objects to extract footage path from metadata
-            def find_camera(obj):
-                if ICamera.matches(obj.getHeader()):
-                    return obj
-                for child in obj.children:
-                    cam = find_camera(child)
-                    if cam:
-                        return cam
-                return None
-
-            camera_obj = find_camera(self.top)
+            camera_obj = self._find_first_camera()
             if camera_obj:
                 camera = ICamera(camera_obj, WrapExistingFlag.kWrapExisting)
                 schema = camera.getSchema()
@@ -334,16 +455,7 @@ class AlembicReader(BaseReader):
         """
         try:
             # Search for camera to extract resolution
-            def find_camera(obj):
-                if ICamera.matches(obj.getHeader()):
-                    return obj
-                for child in obj.children:
-                    cam = find_camera(child)
-                    if cam:
-                        return cam
-                return None
-
-            camera_obj = find_camera(self.top)
+            camera_obj = self._find_first_camera()
             if camera_obj:
                 camera = ICamera(camera_obj, WrapExistingFlag.kWrapExisting)
                 schema = camera.getSchema()
@@ -380,62 +492,112 @@ class AlembicReader(BaseReader):
                 - rotation: [rx, ry, rz] in degrees (XYZ Euler)
                 - scale: [sx, sy, sz]
         """
-        m = np.array(matrix)
+        m = np.asarray(matrix, dtype=np.float64).reshape(1, 4, 4)
+        translations, rotations, scales = self._decompose_matrices(m, maya_compat=maya_compat)
+        return translations[0].tolist(), rotations[0].tolist(), scales[0].tolist()
+
+    def _decompose_matrices(self, matrices, maya_compat=False):
+        """Decompose a stack of 4x4 matrices in one vectorized pass
+
+        Same decomposition as _decompose_matrix, applied to every matrix at
+        once with array operations. The gimbal lock case is selected per
+        matrix with np.where instead of branching. Uses a Numba kernel
+        instead when Numba is installed.
+
+        Args:
+            matrices: (N, 4, 4) array of row-major transformation matrices
+            maya_compat: If True, use Maya-compatible row-major rotation extraction
+
+        Returns:
+            tuple: (translations, rotations, scales) as (N, 3) arrays,
+                   rotations in degrees (XYZ Euler)
+        """
+        m = np.asarray(matrices, dtype=np.float64)
+
+        if NUMBA_AVAILABLE:
+            # JIT-compiled scalar kernel when Numba is installed
+            count = m.shape[0]
+            translations = np.empty((count, 3), dtype=np.float64)
+            rotations = np.empty((count, 3), dtype=np.float64)
+            scales = np.empty((count, 3), dtype=np.float64)
+            _decompose_matrices_jit(np.ascontiguousarray(m), maya_compat, translations, rotations, scales)
+            return translations, rotations, scales
 
         # Extract translation (row 3 contains translation in row-major format)
-        translation = [m[3][0], m[3][1], m[3][2]]
+        translations = m[:, 3, :3]
 
         # Extract scale from row lengths (row-major: rows are transformed basis vectors)
-        sx = np.linalg.norm([m[0][0], m[0][1], m[0][2]])
-        sy = np.linalg.norm([m[1][0], m[1][1], m[1][2]])
-        sz = np.linalg.norm([m[2][0], m[2][1], m[2][2]])
-        scale = [sx, sy, sz]
-
-        # Build normalized rotation matrix
-        rot = np.zeros((3, 3))
-        rot[0][0] = m[0][0] / sx if sx > 0 else m[0][0]
-        rot[0][1] = m[0][1] / sx if sx > 0 else m[0][1]
-        rot[0][2] = m[0][2] / sx if sx > 0 else m[0][2]
-        rot[1][0] = m[1][0] / sy if sy > 0 else m[1][0]
-        rot[1][1] = m[1][1] / sy if sy > 0 else m[1][1]
-        rot[1][2] = m[1][2] / sy if sy > 0 else m[1][2]
-        rot[2][0] = m[2][0] / sz if sz > 0 else m[2][0]
-        rot[2][1] = m[2][1] / sz if sz > 0 else m[2][1]
-        rot[2][2] = m[2][2] / sz if sz > 0 else m[2][2]
-
-        # Extract XYZ Euler angles from rotation matrix
+        scales = np.linalg.norm(m[:, :3, :3], axis=2)
+
+        # Build normalized rotation matrices (rows with zero length are left as-is)
+        divisors = np.where(scales > 0, scales, 1.0)
+        rot = m[:, :3, :3] / divisors[:, :, np.newaxis]
+
+        # Extract XYZ Euler angles from rotation matrices
         if maya_compat:
             # Row-major decomposition for Maya/USD compatibility
-            cy = np.sqrt(rot[0][0]**2 + rot[0][1]**2)
-
-            if cy > 1e-6:
-                # Normal case
-                x = np.arctan2(rot[1][2], rot[2][2])
-                y = np.arctan2(-rot[0][2], cy)
-                z = np.arctan2(-rot[0][1], rot[0][0])  # Negated for correct sign
-            else:
-                # Gimbal lock case
-                x = np.arctan2(-rot[2][1], rot[1][1])
-                y = np.arctan2(-rot[0][2], cy)
-                z = 0
+            cy = np.hypot(rot[:, 0, 0], rot[:, 0, 1])
+            normal = cy > 1e-6
+
+            # Gimbal lock case uses the alternate X extraction and zero Z
+            x = np.where(normal,
+                         np.arctan2(rot[:, 1, 2], rot[:, 2, 2]),
+                         np.arctan2(-rot[:, 2, 1], rot[:, 1, 1]))
+            y = np.arctan2(-rot[:, 0, 2], cy)
+            z = np.where(normal, np.arctan2(-rot[:, 0, 1], rot[:, 0, 0]), 0.0)  # Negated for correct sign
         else:
             # Column-major decomposition for After Effects compatibility
-            sy_test = np.sqrt(rot[0][0]**2 + rot[1][0]**2)
+            sy_test = np.hypot(rot[:, 0, 0], rot[:, 1, 0])
+            normal = sy_test > 1e-6
 
-            if sy_test > 1e-6:
-                # Normal case
-                x = np.arctan2(rot[2][1], rot[2][2])
-                y = np.arctan2(-rot[2][0], sy_test)
-                z = np.arctan2(rot[1][0], rot[0][0])
-            else:
-                # Gimbal lock case
-                x = np.arctan2(-rot[1][2], rot[1][1])
-                y = np.arctan2(-rot[2][0], sy_test)
-                z = 0
+            x = np.where(normal,
+                         np.arctan2(rot[:, 2, 1], rot[:, 2, 2]),
+                         np.arctan2(-rot[:, 1, 2], rot[:, 1, 1]))
+            y = np.arctan2(-rot[:, 2, 0], sy_test)
+            z = np.where(normal, np.arctan2(rot[:, 1, 0], rot[:, 0, 0]), 0.0)
+
+        rotations = np.degrees(np.stack([x, y, z], axis=1))
+
+        return translations, rotations, scales
 
-        rotation = [np.degrees(x), np.degrees(y), np.degrees(z)]
+    def get_transform_at_times(self, obj, times):
+        """Get transform data for many sample times in one batched call
+
+        Samples the world matrix at every time first, then decomposes the
+        whole (N, 4, 4) stack at once for both rotation modes.
+
+        Args:
+            obj: Alembic object (should be IXform or have parent IXform)
+            times: Sequence of sample times in seconds
+
+        Returns:
+            tuple: (translations, rotations_ae, rotations_maya, scales) as
+                   float64 arrays of shape (N, 3)
+        """
+        times = np.asarray(times, dtype=np.float64).ravel()
+        count = times.size
+
+        world = np.empty((count, 4, 4), dtype=np.float64)
+        local = np.empty((count, 4, 4), dtype=np.float64)
+        has_local = False
+
+        for i, time_seconds in enumerate(times.tolist()):
+            local_matrix, world_matrix = self._sample_matrices(obj, time_seconds)
+            world[i] = np.asarray(world_matrix, dtype=np.float64)
+            if local_matrix is not None:
+                local[i] = np.asarray(local_matrix, dtype=np.float64)
+                has_local = True
+
+        translations, rotations_ae, world_scales = self._decompose_matrices(world, maya_compat=False)
+        _, rotations_maya, _ = self._decompose_matrices(world, maya_compat=True)
+
+        # Use local scale (from the object's own matrix), not world scale
+        if has_local:
+            scales = np.linalg.norm(local[:, :3, :3], axis=2)
+        else:
+            scales = world_scales
 
-        return translation, rotation, scale
+        return translations, rotations_ae, rotations_maya, scales
 
     def _get_full_path(self, obj):
         """Get full hierarchy path for an Alembic object
@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import List, Dict, Tuple, Any, Optional
 
+import numpy as np
+
 
 class BaseReader(ABC):
     """Abstract base class for scene file readers
@@ -106,6 +108,37 @@ class BaseReader(ABC):
         """
         pass
 
+    def get_keyframe_transform_at_time(self, obj: Any, time_seconds: float) -> Tuple[List[float], List[float], List[float], List[float]]:
+        """Get transform data with both rotation decompositions at a specific time
+
+        Default implementation samples the transform once per rotation mode.
+        Override in subclasses that can decompose a single sampled matrix twice.
+
+        Args:
+            obj: Scene object
+            time_seconds: Time in seconds to sample
+
+        Returns:
+            tuple: (translation, rotation_ae, rotation_maya, scale)
+        """
+        pos_ae, rot_ae, scale = self.get_transform_at_time(obj, time_seconds, maya_compat=False)
+        _, rot_maya, _ = self.get_transform_at_time(obj, time_seconds, maya_compat=True)
+        return pos_ae, rot_ae, rot_maya, scale
+
+    def is_transform_constant(self, obj: Any) -> bool:
+        """Check whether an object's world transform never changes over time
+
+        Default implementation returns False so every frame is sampled.
+        Override in subclasses that can query constancy from the file.
+
+        Args:
+            obj: Scene object
+
+        Returns:
+            bool: True if the transform is identical at every time sample
+        """
+        return False
+
     @abstractmethod
     def get_mesh_data_at_time(self, mesh_obj: Any, time_seconds: float) -> Dict[str, Any]:
         """Get mesh geometry data at a specific time
@@ -381,6 +414,13 @@ class BaseReader(ABC):
     def _extract_keyframes(self, obj: Any, fps: int, frame_count: int) -> List['Keyframe']:
         """Extract keyframes with both rotation decomposition modes
 
+        Readers may provide an optional batched method
+        get_transform_at_times(obj, times) returning (translations,
+        rotations_ae, rotations_maya, scales), each shaped (len(times), 3).
+        When present it samples every frame in one call; otherwise each
+        frame goes through get_keyframe_transform_at_time. Objects whose
+        transform is_transform_constant() are sampled only once.
+
         Args:
             obj: Scene object to sample
             fps: Frames per second
@@ -391,13 +431,50 @@ class BaseReader(ABC):
         """
         from core.scene_data import Keyframe
 
+        if frame_count < 1:
+            return []
+
+        # Constant transforms are sampled once and repeated for every frame
+        if self.is_transform_constant(obj):
+            pos_ae, rot_ae, rot_maya, scale = self.get_keyframe_transform_at_time(obj, 1 / fps)
+            position, rotation_ae = tuple(pos_ae), tuple(rot_ae)
+            rotation_maya, scale = tuple(rot_maya), tuple(scale)
+            return [
+                Keyframe(
+                    frame=frame,
+                    position=position,
+                    rotation_ae=rotation_ae,
+                    rotation_maya=rotation_maya,
+                    scale=scale
+                )
+                for frame in range(1, frame_count + 1)
+            ]
+
+        # Readers that can sample every frame in one call take the batched path
+        get_transform_at_times = getattr(self, 'get_transform_at_times', None)
+        if get_transform_at_times is not None:
+            times = np.arange(1, frame_count + 1, dtype=np.float64) / fps
+            positions, rotations_ae, rotations_maya, scales = (
+                np.asarray(values, dtype=np.float64).tolist()
+                for values in get_transform_at_times(obj, times)
+            )
+            return [
+                Keyframe(
+                    frame=i + 1,
+                    position=tuple(positions[i]),
+                    rotation_ae=tuple(rotations_ae[i]),
+                    rotation_maya=tuple(rotations_maya[i]),
+                    scale=tuple(scales[i])
+                )
+                for i in range(frame_count)
+            ]
+
         keyframes = []
         for frame in range(1, frame_count + 1):
             time_seconds = frame / fps
 
             # Get both rotation modes
-            pos_ae, rot_ae, scale = self.get_transform_at_time(obj, time_seconds, maya_compat=False)
-            _, rot_maya, _ = self.get_transform_at_time(obj, time_seconds, maya_compat=True)
+            pos_ae, rot_ae, rot_maya, scale = self.get_keyframe_transform_at_time(obj, time_seconds)
 
             keyframes.append(Keyframe(
                 frame=frame,